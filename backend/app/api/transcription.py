@@ -23,7 +23,7 @@ from ..services.transcription_singleton import (
 from ..services.audio_service import AudioService
 from ..models.segment import Segment
 from ..models.speaker import Speaker
-from ..models.audio_file import AudioFile, TranscriptionStatus
+from ..models.audio_file import AudioFile, TranscriptionStatus, TranscriptionStageCode
 
 
 logger = logging.getLogger(__name__)
@@ -190,6 +190,17 @@ def transcribe_task(
 
     except Exception:
         logger.exception("Background transcription task failed for file %s", audio_file_id)
+        # A failure before the service's first stage update would leave a queued file
+        # tagged MODEL_LOADING, and the model-loading progress updater would keep rewriting it
+        try:
+            db.rollback()
+            db.query(AudioFile).filter(AudioFile.id == audio_file_id).update(
+                {AudioFile.transcription_stage_code: None}, synchronize_session=False
+            )
+            db.commit()
+        except Exception:
+            logger.exception("Failed to clear the stage code for file %s", audio_file_id)
+            db.rollback()
         raise
     finally:
         db.close()
@@ -322,11 +333,13 @@ async def start_transcription_with_settings(
             audio_file.transcription_progress = 0.0
             audio_file.error_message = None
             audio_file.processing_stage = "Starting transcription..."
+            audio_file.transcription_stage_code = None
         else:
             # Model loading is first stage: 0-10% of total progress
             audio_file.transcription_progress = 0.05  # 5% for model loading stage
             audio_file.error_message = None
             audio_file.processing_stage = "Loading Whisper model..."
+            audio_file.transcription_stage_code = TranscriptionStageCode.MODEL_LOADING.value
 
         db.commit()
 
@@ -1807,6 +1820,7 @@ def clear_transcription(
     audio_file.model_used = None
     audio_file.processing_stats = None
     audio_file.transcription_stage = "pending"
+    audio_file.transcription_stage_code = None
     audio_file.last_processed_segment = 0
     audio_file.processing_checkpoint = None
     audio_file.resume_token = None
@@ -30,6 +30,8 @@ class Settings(BaseSettings):
     WHISPER_MODEL_SIZE: str = "medium"  # tiny, base, small, medium, large
     WHISPER_DEVICE: str = "auto"  # auto, cpu, cuda, mps
     WHISPER_STRICT_MEMORY: bool = False  # If True, abort when memory below threshold
+    WHISPER_TRANSCRIBE_CONCURRENCY: int = 1  # Max queued transcriptions run at once after the model loads
+    WHISPER_INIT_PROFILE: bool = False  # If True, log memory usage around model loading
     E2E_TRANSCRIPTION_STUB: bool = False  # When true, skip Whisper processing and stub results (for local E2E tests)
 
     # LLM services
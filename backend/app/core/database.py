@@ -1,10 +1,10 @@
 """
 Database connection and session management.
 """
-from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy import bindparam, create_engine, event, inspect, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import NullPool
-from typing import Generator
+from typing import Dict, Generator, List, Set
 
 from .config import settings
 from ..models.base import Base
@@ -28,6 +28,21 @@ if "sqlite" in settings.DATABASE_URL:
         cursor.execute("PRAGMA busy_timeout=30000")
         cursor.close()
 
+# Columns added after the initial schema, applied to legacy databases by init_db().
+_LEGACY_COLUMNS = (
+    ("segments", "is_passive", "BOOLEAN NOT NULL DEFAULT 0"),
+    ("audio_files", "parent_audio_file_id", "INTEGER"),
+    ("audio_files", "split_start_seconds", "FLOAT"),
+    ("audio_files", "split_end_seconds", "FLOAT"),
+    ("audio_files", "split_depth", "INTEGER NOT NULL DEFAULT 0"),
+    ("audio_files", "split_order", "INTEGER NOT NULL DEFAULT 0"),
+    ("audio_files", "transcription_stage_code", "VARCHAR(32)"),
+)
+# Indexes created alongside a legacy column when it is added.
+_LEGACY_INDEXES = {
+    ("audio_files", "transcription_stage_code"): "ix_audio_files_transcription_stage_code",
+}
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -51,6 +66,33 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def _existing_legacy_columns() -> Dict[str, Set[str]]:
+    """Return which of the legacy columns already exist, keyed by table."""
+    wanted: Dict[str, List[str]] = {}
+    for table, column, _ in _LEGACY_COLUMNS:
+        wanted.setdefault(table, []).append(column)
+
+    if engine.dialect.name != "sqlite":
+        inspector = inspect(engine)
+        return {
+            table: {col["name"] for col in inspector.get_columns(table)} & set(columns)
+            for table, columns in wanted.items()
+        }
+
+    # pragma_table_info filters inside SQLite instead of reflecting every column
+    existing: Dict[str, Set[str]] = {}
+    with engine.connect() as conn:
+        for table, columns in wanted.items():
+            rows = conn.execute(
+                text("SELECT name FROM pragma_table_info(:table) WHERE name IN :columns").bindparams(
+                    bindparam("columns", expanding=True)
+                ),
+                {"table": table, "columns": columns},
+            )
+            existing[table] = {row[0] for row in rows}
+    return existing
+
+
 def init_db() -> None:
     """
     Initialize database tables with complete schema.
@@ -69,35 +111,37 @@ def init_db() -> None:
 
     # Ensure new columns exist on legacy databases (development convenience).
     try:
-        inspector = inspect(engine)
-        with engine.begin() as conn:
-            segment_columns = {col["name"] for col in inspector.get_columns("segments")}
-            if "is_passive" not in segment_columns:
-                conn.execute(
-                    text("ALTER TABLE segments ADD COLUMN is_passive BOOLEAN NOT NULL DEFAULT 0")
-                )
-
-            audio_columns = {col["name"] for col in inspector.get_columns("audio_files")}
-            if "parent_audio_file_id" not in audio_columns:
-                conn.execute(
-                    text("ALTER TABLE audio_files ADD COLUMN parent_audio_file_id INTEGER")
-                )
-            if "split_start_seconds" not in audio_columns:
-                conn.execute(
-                    text("ALTER TABLE audio_files ADD COLUMN split_start_seconds FLOAT")
-                )
-            if "split_end_seconds" not in audio_columns:
-                conn.execute(
-                    text("ALTER TABLE audio_files ADD COLUMN split_end_seconds FLOAT")
-                )
-            if "split_depth" not in audio_columns:
-                conn.execute(
-                    text("ALTER TABLE audio_files ADD COLUMN split_depth INTEGER NOT NULL DEFAULT 0")
-                )
-            if "split_order" not in audio_columns:
-                conn.execute(
-                    text("ALTER TABLE audio_files ADD COLUMN split_order INTEGER NOT NULL DEFAULT 0")
-                )
+        existing_columns = _existing_legacy_columns()
+
+        is_sqlite = engine.dialect.name == "sqlite"
+        missing: Dict[str, List[str]] = {}
+        index_statements = []
+        for table, column, column_ddl in _LEGACY_COLUMNS:
+            if column in existing_columns[table]:
+                continue
+            missing.setdefault(table, []).append(f"ADD COLUMN {column} {column_ddl}")
+            index_name = _LEGACY_INDEXES.get((table, column))
+            if index_name:
+                index_statements.append(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} ({column})")
+
+        statements = []
+        for table, clauses in missing.items():
+            if is_sqlite:
+                # SQLite accepts only one ADD COLUMN per ALTER TABLE
+                statements.extend(f"ALTER TABLE {table} {clause}" for clause in clauses)
+            else:
+                # Other backends rewrite/lock the table once for all new columns
+                statements.append(f"ALTER TABLE {table} " + ", ".join(clauses))
+        statements.extend(index_statements)
+
+        if statements:
+            with engine.begin() as conn:
+                if is_sqlite:
+                    # pysqlite runs DDL outside a transaction unless one is opened explicitly;
+                    # take the write lock once so all ALTERs commit (or fail) together.
+                    conn.exec_driver_sql("BEGIN IMMEDIATE")
+                for statement in statements:
+                    conn.exec_driver_sql(statement)
     except Exception:
         # Do not block application startup if inspection fails (e.g., table missing)
         pass
@@ -4,7 +4,8 @@ FastAPI main application entry point.
 import os
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Query
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 import logging
 from .core import database
@@ -161,10 +162,19 @@ async def health_simple():
 
 
 @app.get("/health")
-async def health():
-    """Non-blocking health check with essential transcription status."""
+async def health(wait: float = Query(0.0, ge=0.0, le=30.0)):
+    """
+    Health check with essential transcription status.
+
+    Non-blocking by default; pass ``wait`` (seconds) to long-poll until the
+    Whisper model is ready instead of re-polling every second.
+    """
     import time
     from pathlib import Path
+
+    if wait > 0:
+        from .services.transcription_singleton import wait_until_ready
+        await run_in_threadpool(wait_until_ready, wait)
     
     components = {
         "api": {"status": "up", "message": "FastAPI running"},
@@ -23,6 +23,11 @@ class TranscriptionStatus(str, enum.Enum):
     FAILED = "FAILED"
 
 
+class TranscriptionStageCode(str, enum.Enum):
+    """Indexed short codes for stages that are queried, alongside the free-form stage text."""
+    MODEL_LOADING = "MODEL_LOADING"
+
+
 class AudioFile(Base, TimestampMixin):
     """An audio file uploaded for transcription."""
 
@@ -66,6 +71,7 @@ class AudioFile(Base, TimestampMixin):
     audio_transformation_path: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Path to transformed audio file
     whisper_model_loaded: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Currently loaded Whisper model
     transcription_stage: Mapped[str] = mapped_column(Text, default='pending', nullable=False)  # Current processing stage
+    transcription_stage_code: Mapped[Optional[str]] = mapped_column(String(32), nullable=True, index=True)  # TranscriptionStageCode for indexed lookups
     last_processed_segment: Mapped[int] = mapped_column(Integer, default=0, nullable=False)  # Last completed segment index
     processing_checkpoint: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON checkpoint data
     resume_token: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Unique token for resume operations
@@ -273,7 +273,8 @@ class OllamaProvider(LLMProvider):
         available_models = await self.list_models()
         return model in available_models
 
-    def _parse_correction(self, llm_response: str, original: str) -> str:
+    @staticmethod
+    def _parse_correction(llm_response: str, original: str) -> str:
         """
         Parse the LLM response to extract just the corrected text.
         Sometimes LLMs add extra commentary or include context.
@@ -1,20 +1,22 @@
 """Transcription service using Whisper."""
 from __future__ import annotations
 
+import functools
 import time
 import os
 import psutil
 import json
 import logging
+import pickle
 import threading
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
 from sqlalchemy.orm import Session
 
 from ..core.config import settings
 from ..core.logging_config import get_transcription_logger
 from ..core import database
-from ..models.audio_file import AudioFile, TranscriptionStatus
+from ..models.audio_file import AudioFile, TranscriptionStatus, TranscriptionStageCode
 from ..models.segment import Segment
 from .audio_service import AudioService
 
@@ -67,6 +69,13 @@ def normalize_model_name(value: Optional[str]) -> Optional[str]:
     return MODEL_NAME_ALIASES.get(normalized)
 
 
+@functools.lru_cache(maxsize=None)
+def whisper_cache_dir() -> str:
+    """Return Whisper's download directory, honouring XDG_CACHE_HOME like whisper.load_model."""
+    cache_root = os.getenv("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(cache_root, "whisper")
+
+
 class TranscriptionService:
     """Service for transcribing audio files using Whisper."""
 
@@ -197,12 +206,17 @@ class TranscriptionService:
                 
         return recommendations
 
-    def load_model(self, model_size: Optional[str] = None):
+    def load_model(
+        self,
+        model_size: Optional[str] = None,
+        progress_callback: Optional[Callable[[str], None]] = None,
+    ):
         """
         Load a Whisper model (lazy loading with caching).
 
         Args:
             model_size: Optional model size override (tiny, base, small, medium, large)
+            progress_callback: Optional callable receiving a status message at each loading stage
 
         Returns:
             Loaded Whisper model instance.
@@ -221,9 +235,8 @@ class TranscriptionService:
         logger.info(f"Loading Whisper model: {target_size} (device: {self.device})")
         # Attempt to load on the preferred device, but fall back to CPU on failure
         try:
-            model = whisper_module.load_model(
-                target_size,
-                device=self.device
+            model = self._load_whisper_model(
+                whisper_module, target_size, self.device, progress_callback=progress_callback
             )
         except Exception as e:
             logger.warning(
@@ -231,9 +244,8 @@ class TranscriptionService:
                 "Attempting to fall back to CPU."
             )
             try:
-                model = whisper_module.load_model(
-                    target_size,
-                    device="cpu"
+                model = self._load_whisper_model(
+                    whisper_module, target_size, "cpu", progress_callback=progress_callback
                 )
                 # Use CPU for subsequent operations to avoid repeated failures
                 self.device = "cpu"
@@ -254,9 +266,68 @@ class TranscriptionService:
 
         return model
 
-    def _update_progress_with_stage(self, audio_file: AudioFile, stage: str, progress: float, db: Session, elapsed_time: float = None):
+    def _load_whisper_model(
+        self,
+        whisper_module,
+        target_size: str,
+        device: str,
+        progress_callback: Optional[Callable[[str], None]] = None,
+    ):
+        """
+        Load a Whisper model, memory-mapping the checkpoint when possible.
+
+        ``whisper.load_model`` reads the whole checkpoint into RAM and then copies it into the
+        freshly built module. Loading with ``mmap=True`` and assigning the tensors keeps the
+        checkpoint in the page cache instead of a second in-process copy. Falls back to
+        ``whisper.load_model`` for unknown model names or torch/whisper versions without support.
+
+        ``progress_callback`` is told when the checkpoint is on disk and when it is in memory.
+        The ``whisper.load_model`` fallback downloads and loads in one opaque call, so it
+        reports nothing; callers can still watch the download cache.
+
+        Written against openai-whisper 20231117 (pinned in requirements.txt): it relies on the
+        private ``_MODELS``, ``_download`` and ``_ALIGNMENT_HEADS``. Check them when upgrading.
+        """
+        known_models = getattr(whisper_module, "_MODELS", None)
+        if known_models is None or target_size not in known_models:
+            return whisper_module.load_model(target_size, device=device)
+
+        try:
+            import torch
+            from whisper.model import ModelDimensions, Whisper
+
+            checkpoint_path = whisper_module._download(known_models[target_size], whisper_cache_dir(), False)
+            if progress_callback:
+                progress_callback("Complete - loading into memory")
+            checkpoint = torch.load(checkpoint_path, map_location="cpu", mmap=True, weights_only=True)
+            # Built on CPU rather than the meta device: Whisper's non-persistent buffers
+            # (e.g. the decoder mask) are not part of the state dict and must be materialized.
+            model = Whisper(ModelDimensions(**checkpoint["dims"]))
+            model.load_state_dict(checkpoint["model_state_dict"], assign=True)
+            del checkpoint
+            model.set_alignment_heads(whisper_module._ALIGNMENT_HEADS[target_size])
+        except (ImportError, AttributeError, TypeError, RuntimeError, pickle.UnpicklingError) as e:
+            # Missing internals, torch without mmap, or a checkpoint torch cannot map (e.g. legacy format)
+            logger.debug(f"Memory-mapped Whisper load unavailable ({e}); using whisper.load_model")
+            return whisper_module.load_model(target_size, device=device)
+
+        if progress_callback:
+            progress_callback(f"Loaded - moving to {device}")
+        # Checkpoints are stored in fp16; keep the fp32 parameters whisper.load_model produces
+        return model.to(device=device, dtype=torch.float32)
+
+    def _update_progress_with_stage(
+        self,
+        audio_file: AudioFile,
+        stage: str,
+        progress: float,
+        db: Session,
+        elapsed_time: float = None,
+        stage_code: Optional[TranscriptionStageCode] = None,
+    ):
         """Update progress with stage information and timing."""
         audio_file.transcription_progress = progress
+        audio_file.transcription_stage_code = stage_code.value if stage_code else None
         
         # Add timing info to stage only if it doesn't already contain timing
         if elapsed_time is not None and not ('(' in stage and 's)' in stage):
@@ -306,8 +377,11 @@ class TranscriptionService:
             "metadata": metadata or {}
         }
         
-        # Update audio file state
+        # Update audio file state; the stage code always follows the stage text
         audio_file.transcription_stage = stage
+        audio_file.transcription_stage_code = (
+            TranscriptionStageCode.MODEL_LOADING.value if stage == "loading_model" else None
+        )
         audio_file.last_processed_segment = segment_index
         audio_file.processing_checkpoint = json.dumps(checkpoint_data)
         
@@ -648,6 +722,7 @@ class TranscriptionService:
             audio_file.model_used = "stub"
             audio_file.processing_stats = json.dumps({"stub": True})
             audio_file.transcription_stage = "completed"
+            audio_file.transcription_stage_code = None
             audio_file.last_processed_segment = len(segments)
             audio_file.resume_token = None
             audio_file.interruption_count = 0
@@ -753,6 +828,7 @@ class TranscriptionService:
                 if settings.WHISPER_STRICT_MEMORY:
                     logger.error(error_msg)
                     audio_file.transcription_status = TranscriptionStatus.FAILED
+                    audio_file.transcription_stage_code = None
                     audio_file.error_message = "Transcription failed: " + error_msg
                     db.commit()
                     raise RuntimeError(error_msg)
@@ -817,7 +893,14 @@ class TranscriptionService:
             # Save model loading checkpoint
             self.save_transcription_checkpoint(audio_file, "loading_model", 0, {}, db)
 
-            self._update_progress_with_stage(audio_file, "Loading Whisper model", 0.10, db, elapsed)
+            self._update_progress_with_stage(
+                audio_file,
+                "Loading Whisper model",
+                0.10,
+                db,
+                elapsed,
+                stage_code=TranscriptionStageCode.MODEL_LOADING,
+            )
 
             # Check system resources before model loading
             try:
@@ -1076,6 +1159,7 @@ class TranscriptionService:
             }
             
             audio_file.transcription_status = TranscriptionStatus.FAILED
+            audio_file.transcription_stage_code = None
             audio_file.error_message = f"Transcription failed: {str(e)}"
             audio_file.processing_stats = json.dumps(error_details)
             
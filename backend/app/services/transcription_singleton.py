@@ -1,32 +1,104 @@
 """
 Global transcription service singleton to avoid repeated model downloads.
 """
+import functools
+import logging
+import os
+import queue
+import sys
 import threading
-from typing import Optional, Dict, Any, List
+import time
+from typing import Callable, Optional, Dict, Any, List, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows has no resource module
+    resource = None
+
 from .transcription_service import (
     TranscriptionService,
     MODEL_PRIORITIES,
     normalize_model_name,
+    whisper_cache_dir,
 )
 from ..core.config import settings
+from ..core.database import get_db
+from ..models.audio_file import AudioFile, TranscriptionStageCode
+
+logger = logging.getLogger(__name__)
 
 # Global instance and lock for thread safety
 _global_transcription_service: Optional[TranscriptionService] = None
 _initialization_lock = threading.Lock()
 _initialization_in_progress = False
-_model_ready = False
+# Set once the model is loaded and the global service is published
+_ready_event = threading.Event()
+
+# Model sizes in MB (actual file sizes from disk)
+_MODEL_SIZES_MB = {
+    "tiny": 72,      # Actual: 72MB
+    "tiny.en": 72,
+    "base": 142,
+    "base.en": 142,
+    "small": 461,    # Actual: 461MB
+    "small.en": 461,
+    "medium": 1460,
+    "medium.en": 1460,
+    "turbo": 1540,
+    "large": 2900,
+    "large-v1": 2900,
+    "large-v2": 2900,
+    "large-v3": 2900,
+}
+
+# On-disk checkpoint names in Whisper's cache, in lookup order. Aliases such as
+# "large" and "turbo" are saved under the name of the checkpoint they resolve to.
+_MODEL_FILENAMES: Dict[str, Tuple[str, ...]] = {
+    "tiny": ("tiny.pt",),
+    "tiny.en": ("tiny.en.pt",),
+    "base": ("base.pt",),
+    "base.en": ("base.en.pt",),
+    "small": ("small.pt",),
+    "small.en": ("small.en.pt",),
+    "medium": ("medium.pt",),
+    "medium.en": ("medium.en.pt",),
+    "large": ("large-v3.pt", "large-v2.pt", "large.pt"),
+    "large-v1": ("large-v1.pt",),
+    "large-v2": ("large-v2.pt",),
+    "large-v3": ("large-v3.pt",),
+    "turbo": ("large-v3-turbo.pt",),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _expected_model_size(model_size: str) -> Tuple[int, str]:
+    """Return the expected download size of a model in MB and its display string."""
+    model_size_mb = _MODEL_SIZES_MB.get(model_size, 142)  # Default to base size
+    model_size_display = f"{model_size_mb}MB" if model_size_mb < 1000 else f"{model_size_mb/1000:.1f}GB"
+    return model_size_mb, model_size_display
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Peak resident memory of this process in MB, from a single getrusage call."""
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
 
 
-def _model_cache_candidates(model_size: str) -> List[str]:
+def _model_cache_candidates(model_size: str) -> Tuple[str, ...]:
     """Return possible cache filenames for a given model."""
-    special_cases = {
-        "large": ["large-v3.pt", "large-v2.pt", "large.pt"],
-        "large-v1": ["large-v1.pt"],
-        "large-v2": ["large-v2.pt"],
-        "large-v3": ["large-v3.pt"],
-        "turbo": ["turbo.pt"],
-    }
-    return special_cases.get(model_size, [f"{model_size}.pt"])
+    return _MODEL_FILENAMES.get(model_size) or (f"{model_size}.pt",)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_model_paths(model_size: str) -> Tuple[Tuple[str, str], ...]:
+    """Return (filename, absolute path) pairs for a model's cache candidates."""
+    return tuple(
+        (candidate, os.path.join(whisper_cache_dir(), candidate))
+        for candidate in _model_cache_candidates(model_size)
+    )
 
 
 def _normalize_model_size(value: Optional[str]) -> Optional[str]:
@@ -36,13 +108,17 @@ def _normalize_model_size(value: Optional[str]) -> Optional[str]:
 
 def _determine_initial_model_size() -> str:
     """Decide which Whisper model should be initialized first."""
-    from ..core.config import settings
-
+    # Read per call so runtime changes to WHISPER_MODEL_SIZE take effect
     configured = normalize_model_name(settings.WHISPER_MODEL_SIZE) or "base"
+    if not _pending_transcriptions:
+        return configured
+
+    with _pending_lock:
+        requested_models = [entry.get("model_size") for entry in _pending_transcriptions.values()]
 
     pending_models: List[str] = []
-    for entry in _pending_transcriptions:
-        model_value = _normalize_model_size(entry.get("model_size"))
+    for requested in requested_models:
+        model_value = _normalize_model_size(requested)
         if model_value:
             pending_models.append(model_value)
 
@@ -57,7 +133,12 @@ def _determine_initial_model_size() -> str:
 def get_transcription_service() -> TranscriptionService:
     """Get the global transcription service instance."""
     global _global_transcription_service, _initialization_in_progress
-    
+
+    # Fast path: once published, the service reference is read without taking the lock
+    service = _global_transcription_service
+    if service is not None and service.model is not None:
+        return service
+
     with _initialization_lock:
         if _global_transcription_service is None:
             if _initialization_in_progress:
@@ -73,16 +154,14 @@ def get_transcription_service() -> TranscriptionService:
 
 def is_transcription_service_ready() -> bool:
     """Check if the transcription service is ready for use."""
-    global _global_transcription_service, _initialization_in_progress
-    
-    with _initialization_lock:
-        if _initialization_in_progress:
-            return False  # Still initializing
-            
-        return (
-            _global_transcription_service is not None and 
-            _global_transcription_service.model is not None
-        )
+    # The event is set only once a loaded service is published, so this is a
+    # lock-free flag read on the health-check path.
+    return _ready_event.is_set()
+
+
+def wait_until_ready(timeout: Optional[float] = None) -> bool:
+    """Block until the transcription service is ready; return False on timeout."""
+    return _ready_event.wait(timeout)
 
 
 def is_initialization_in_progress() -> bool:
@@ -105,17 +184,9 @@ def get_target_model_size() -> str:
     return _determine_initial_model_size()
 
 
-def _mark_model_ready(is_ready: bool) -> None:
-    """Update internal readiness flag."""
-    global _model_ready
-    _model_ready = is_ready
-
-
 def is_model_cached_on_disk(model_size: str = None) -> bool:
     """Check if any Whisper model is already downloaded and cached on disk."""
-    import os
-    
-    cache_dir = os.path.expanduser("~/.cache/whisper")
+    cache_dir = whisper_cache_dir()
     if not os.path.exists(cache_dir):
         return False
     
@@ -129,17 +200,7 @@ def is_model_cached_on_disk(model_size: str = None) -> bool:
             return False
     else:
         # Check for specific model
-        cache_candidates = _model_cache_candidates(model_size)
-        for candidate in cache_candidates:
-            model_path = os.path.join(cache_dir, candidate)
-            if os.path.exists(model_path):
-                return True
-        return False
-
-
-def is_model_ready() -> bool:
-    """Return True if the Whisper model has been loaded into memory."""
-    return _model_ready
+        return any(os.path.exists(model_path) for _, model_path in _resolve_model_paths(model_size))
 
 
 def initialize_transcription_service() -> None:
@@ -149,104 +210,92 @@ def initialize_transcription_service() -> None:
     with _initialization_lock:
         # Check if already initialized
         if _global_transcription_service is not None:
-            print("Transcription service already initialized.")
+            logger.debug("Transcription service already initialized.")
             return
             
         # Check if initialization is already in progress
         if _initialization_in_progress:
-            print("Transcription service initialization already in progress.")
+            logger.debug("Transcription service initialization already in progress.")
             return
             
         # Mark initialization as in progress
         _initialization_in_progress = True
     
     try:
-        _mark_model_ready(False)
+        _ready_event.clear()
         if settings.E2E_TRANSCRIPTION_STUB:
-            print("🤖 [E2E] Initializing transcription stub service (skipping Whisper download)...")
+            logger.info("[E2E] Initializing transcription stub service (skipping Whisper download)")
             service = TranscriptionService(model_size_override="tiny")
             service.model = "stub"  # Mark as ready without loading actual model
             with _initialization_lock:
                 _global_transcription_service = service
                 _initialization_in_progress = False
-                _mark_model_ready(True)
-            process_pending_transcriptions()
+                _ready_event.set()
+            _start_pending_drain()
             return
 
-        print("🤖 Initializing Whisper transcription service...")
         desired_model_size = _determine_initial_model_size()
-        
-        # Monitor memory usage
-        import psutil
-        process = psutil.Process()
-        initial_memory = process.memory_info().rss / 1024 / 1024
-        print(f"💾 Initial memory usage: {initial_memory:.1f}MB")
-        
+
+        # Memory sampling is opt-in
+        profile = settings.WHISPER_INIT_PROFILE
+
         # Create service instance
         service = TranscriptionService(model_size_override=desired_model_size)
-        if service.model_size != service.configured_model_size:
-            print(
-                f"Pending transcription requested Whisper '{service.model_size}' "
-                f"(configured default: '{service.configured_model_size}'). Using requested model for initialization."
-            )
         
         # Check if model cache exists before loading
-        import os
-        # Lazy import whisper to avoid blocking during module import
-        
         model_size = service.model_size
-        cache_dir = os.path.expanduser("~/.cache/whisper")
         
         # Resolve potential cache filenames for the selected model
-        cache_candidates = _model_cache_candidates(model_size)
-        model_filename = cache_candidates[0]
+        model_paths = _resolve_model_paths(model_size)
+        model_filename = model_paths[0][0]
         existing_path = None
-        for candidate in cache_candidates:
-            candidate_path = os.path.join(cache_dir, candidate)
+        for candidate, candidate_path in model_paths:
             if os.path.exists(candidate_path):
                 existing_path = candidate_path
                 model_filename = candidate
                 break
         
-        if existing_path:
-            file_size = os.path.getsize(existing_path) / (1024 * 1024)
-            print(f"Found cached Whisper model '{model_filename}' ({file_size:.1f}MB) - loading from cache...")
-        else:
-            print(f"Whisper model '{model_filename}' not cached - downloading...")
-            print("Please wait - this may take several minutes on first download...")
-        
-        # Load model with memory monitoring
-        print(f"🔄 Loading Whisper model '{model_size}' into memory...")
-        pre_load_memory = process.memory_info().rss / 1024 / 1024
-        print(f"💾 Memory before model load: {pre_load_memory:.1f}MB")
-        
-        service.load_model()  # This will block until loading completes
-        _mark_model_ready(True)
-        
-        post_load_memory = process.memory_info().rss / 1024 / 1024
-        memory_increase = post_load_memory - pre_load_memory
-        print(f"Memory after model load: {post_load_memory:.1f}MB (+{memory_increase:.1f}MB)")
-        print(f"Whisper model '{model_size}' loaded successfully!")
-        print("Transcription service ready - API can now accept requests.")
+        if not existing_path:
+            logger.info("Whisper model '%s' not cached - downloading (may take several minutes)", model_filename)
+
+        pre_load_peak = _peak_rss_mb() if profile else None
+        started = time.monotonic()
+
+        # Blocks until loading completes; stages are published for the progress endpoint
+        service.load_model(progress_callback=_model_load_reporter(model_size))
+
+        memory_note = ""
+        post_load_peak = _peak_rss_mb() if profile else None
+        if pre_load_peak is not None and post_load_peak is not None:
+            memory_note = f", peak memory {post_load_peak:.1f}MB (+{post_load_peak - pre_load_peak:.1f}MB)"
+        logger.info(
+            "Whisper model '%s' loaded from %s in %.1fs (configured default '%s')%s",
+            model_size,
+            "cache" if existing_path else "download",
+            time.monotonic() - started,
+            service.configured_model_size,
+            memory_note,
+        )
         
         # Set the global service atomically
         with _initialization_lock:
             _global_transcription_service = service
             _initialization_in_progress = False
+            _ready_event.set()
+        set_model_download_progress(None)
         
-        # Process any pending transcription requests
-        process_pending_transcriptions()
+        # Process any pending transcription requests without holding up the caller
+        _start_pending_drain()
         
     except Exception as e:
-        import traceback
-        print(f"Failed to load Whisper model: {e}")
-        print(f"Stack trace: {traceback.format_exc()}")
+        logger.exception("Failed to load Whisper model: %s", e)
         
         # Clear initialization state on failure
         with _initialization_lock:
             _global_transcription_service = None
             _initialization_in_progress = False
-            _mark_model_ready(False)
+            _ready_event.clear()
+        set_model_download_progress(None)
             
         raise RuntimeError(f"Whisper initialization failed: {e}")
 
@@ -256,47 +305,47 @@ def get_model_download_progress() -> Optional[Dict[str, Any]]:
     Get current model download/loading progress.
     Returns dict with progress info or None if not downloading.
     """
-    global _download_progress, _global_transcription_service
+    global _global_transcription_service
     
     # If service is ready, no progress needed
     if _global_transcription_service and _global_transcription_service.model:
         return None
     
     # If we have tracked progress, return it
-    if _download_progress:
-        return _download_progress.copy()
+    with _download_progress_lock:
+        if _download_progress:
+            return _download_progress.copy()
     
     # Check if model file already exists (download completed)
-    import os
-    import glob
     model_size = get_target_model_size()
-    cache_dir = os.path.expanduser("~/.cache/whisper")
-    
-    # Model sizes in MB (actual file sizes from disk)
-    model_sizes = {
-        "tiny": 72,      # Actual: 72MB
-        "tiny.en": 72,
-        "base": 142,
-        "base.en": 142,
-        "small": 461,    # Actual: 461MB
-        "small.en": 461,
-        "medium": 1460,
-        "medium.en": 1460,
-        "turbo": 1540,
-        "large": 2900,
-        "large-v1": 2900,
-        "large-v2": 2900,
-        "large-v3": 2900,
-    }
-    
-    model_size_mb = model_sizes.get(model_size, 142)  # Default to base size
-    model_size_display = f"{model_size_mb}MB" if model_size_mb < 1000 else f"{model_size_mb/1000:.1f}GB"
+    cache_dir = whisper_cache_dir()
+    model_size_mb, model_size_display = _expected_model_size(model_size)
     
     cache_candidates = _model_cache_candidates(model_size)
+    partial_prefixes = tuple(candidate.rsplit(".pt", 1)[0] for candidate in cache_candidates)
+
+    # One directory read serves both the completed-file and partial-file checks
+    cached_entries: Dict[str, os.DirEntry] = {}
+    partial_entry: Optional[os.DirEntry] = None
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name in cache_candidates:
+                    cached_entries[name] = entry
+                elif (
+                    partial_entry is None
+                    and name.startswith(partial_prefixes)
+                    and name.endswith((".pt.tmp", ".pt.part"))
+                ):
+                    partial_entry = entry
+    except OSError:
+        pass
+
     for candidate in cache_candidates:
-        model_path = os.path.join(cache_dir, candidate)
-        if os.path.exists(model_path):
-            file_size_mb = os.path.getsize(model_path) / (1024 * 1024)
+        model_entry = cached_entries.get(candidate)
+        if model_entry is not None:
+            file_size_mb = model_entry.stat().st_size / (1024 * 1024)
             downloaded_display = f"{int(file_size_mb)}MB" if file_size_mb < 1000 else f"{file_size_mb/1000:.1f}GB"
 
             # Check if file is still being downloaded (file size < expected size)
@@ -326,22 +375,10 @@ def get_model_download_progress() -> Optional[Dict[str, Any]]:
     # Check if we're in the process of loading/downloading
     if not is_transcription_service_ready():
         # Check if download is in progress by looking for partial file or active downloads
-        import glob
-        partial_patterns = []
-        for candidate in cache_candidates:
-            base = candidate.rsplit(".pt", 1)[0]
-            partial_patterns.append(os.path.join(cache_dir, f"{base}*.pt.tmp"))
-            partial_patterns.append(os.path.join(cache_dir, f"{base}*.pt.part"))
-
-        partial_files = []
-        for pattern in partial_patterns:
-            partial_files.extend(glob.glob(pattern))
-    
-        if partial_files:
+        if partial_entry is not None:
             # Get the size of the downloading file
-            partial_file = partial_files[0]
             try:
-                current_size_bytes = os.path.getsize(partial_file)
+                current_size_bytes = partial_entry.stat(follow_symlinks=False).st_size
                 current_size_mb = current_size_bytes / (1024 * 1024)
                 progress = min(int((current_size_mb / model_size_mb) * 100), 99)  # Cap at 99% until complete
                 
@@ -356,7 +393,6 @@ def get_model_download_progress() -> Optional[Dict[str, Any]]:
         
         # Only show time-based estimation if we have marked a start time (download actually triggered)
         if hasattr(get_model_download_progress, '_start_time'):
-            import time
             elapsed = time.time() - get_model_download_progress._start_time
             estimated_total_time = model_size_mb / 4  # seconds for download at ~4MB/s
             estimated_progress = min(int((elapsed / estimated_total_time) * 100), 95)  # Allow up to 95%
@@ -371,8 +407,6 @@ def get_model_download_progress() -> Optional[Dict[str, Any]]:
     
     return None  # No download in progress
 
-    return None
-
 
 def update_model_loading_progress_in_db() -> None:
     """
@@ -391,20 +425,20 @@ def update_model_loading_progress_in_db() -> None:
     main_progress_fraction = main_progress / 100.0  # Convert to 0.0-0.10 for database
 
     # Find all files waiting for model loading
-    from ..core.database import get_db
-    from ..models.audio_file import AudioFile
-
     db = next(get_db())
     try:
-        # Find files with status=PROCESSING and stage containing "Loading Whisper model"
+        # Find files waiting on the model (indexed stage code, no leading-wildcard scan)
         files_waiting = db.query(AudioFile).filter(
-            AudioFile.transcription_stage.ilike("%Loading Whisper model%")
+            AudioFile.transcription_stage_code == TranscriptionStageCode.MODEL_LOADING.value
         ).all()
 
         if files_waiting:
             for audio_file in files_waiting:
-                # Update progress (0.0 to 0.10)
-                audio_file.transcription_progress = main_progress_fraction
+                # Update progress (0.0 to 0.10), never below what the file already shows:
+                # the start endpoint queues files at 5% before any download is reported
+                audio_file.transcription_progress = max(
+                    audio_file.transcription_progress or 0.0, main_progress_fraction
+                )
 
             db.commit()
             print(f"Updated model loading progress to {main_progress:.1f}% ({download_percent}% download) for {len(files_waiting)} file(s)")
@@ -415,18 +449,47 @@ def update_model_loading_progress_in_db() -> None:
         db.close()
 
 
-# Global progress tracking
-_download_progress = None
+# Global progress tracking, reported by the loader through _model_load_reporter()
+_download_progress: Optional[Dict[str, Any]] = None
+_download_progress_lock = threading.Lock()
+
 
-# Track pending transcription requests (file_id, include_diarization)
-_pending_transcriptions: List[dict] = []
+def set_model_download_progress(progress: Optional[Dict[str, Any]]) -> None:
+    """Record model download progress reported by the loader (None clears it)."""
+    global _download_progress
+
+    with _download_progress_lock:
+        _download_progress = dict(progress) if progress else None
+
+
+def _model_load_reporter(model_size: str) -> Callable[[str], None]:
+    """Build the load_model progress callback that publishes stages for model_size."""
+    _, total_display = _expected_model_size(model_size)
+
+    def report(message: str) -> None:
+        # The loader only reports once the checkpoint is fully on disk
+        set_model_download_progress({
+            'progress': 100,
+            'downloaded': total_display,
+            'total': total_display,
+            'speed': message,
+            'model_size': model_size,
+        })
+
+    return report
+
+
+# Track pending transcription requests keyed by file_id (insertion-ordered)
+_pending_transcriptions: Dict[int, dict] = {}
+_pending_lock = threading.Lock()
 
 
 def cleanup_transcription_service() -> None:
     """Clean up the global transcription service."""
     global _global_transcription_service
     _global_transcription_service = None
-    _mark_model_ready(False)
+    _ready_event.clear()
+    set_model_download_progress(None)
     print("Transcription service cleaned up.")
 
 
@@ -439,23 +502,12 @@ def add_pending_transcription(
     force_restart: bool = False,
 ) -> None:
     """Add or update a transcription request in the pending queue."""
-    global _pending_transcriptions
-
-    for entry in _pending_transcriptions:
-        if entry["file_id"] == file_id:
-            entry.update(
-                {
-                    "include_diarization": include_diarization,
-                    "model_size": model_size,
-                    "language": language,
-                    "force_restart": force_restart,
-                }
-            )
-            break
-    else:
-        _pending_transcriptions.append(
+    with _pending_lock:
+        entry = _pending_transcriptions.get(file_id)
+        if entry is None:
+            entry = _pending_transcriptions[file_id] = {"file_id": file_id}
+        entry.update(
             {
-                "file_id": file_id,
                 "include_diarization": include_diarization,
                 "model_size": model_size,
                 "language": language,
@@ -467,51 +519,80 @@ def add_pending_transcription(
 
 
 def get_pending_transcriptions() -> list:
-    """Get and clear the list of pending transcriptions."""
+    """Get and clear the list of pending transcriptions.
+
+    Entries are handed out as-is (callers only read them), so no per-entry copy is made.
+    """
     global _pending_transcriptions
-    pending = [entry.copy() for entry in _pending_transcriptions]
-    _pending_transcriptions.clear()
-    return pending
+
+    # Swap in a fresh queue under the lock; the old one is drained outside it
+    with _pending_lock:
+        pending, _pending_transcriptions = _pending_transcriptions, {}
+    return list(pending.values())
 
 
 def has_pending_transcriptions() -> bool:
     """Check if there are pending transcription requests."""
-    global _pending_transcriptions
-    return len(_pending_transcriptions) > 0
+    return bool(_pending_transcriptions)
+
+
+def _run_pending_transcriptions(entries: "queue.SimpleQueue[dict]") -> None:
+    """Worker loop: run queued transcriptions one after another until the queue is empty."""
+    # Import here to avoid circular imports
+    from ..api.transcription import transcribe_task
+
+    while True:
+        try:
+            entry = entries.get_nowait()
+        except queue.Empty:
+            return
+
+        file_id = entry["file_id"]
+        try:
+            logger.info("Starting queued transcription for file %s", file_id)
+            transcribe_task(
+                audio_file_id=file_id,
+                include_diarization=entry.get("include_diarization", True),
+                model_size=entry.get("model_size"),
+                language=entry.get("language"),
+                force_restart=entry.get("force_restart", False),
+            )
+        except Exception:
+            # Daemon worker: log the traceback and move on to the next queued file
+            logger.exception("Queued transcription failed for file %s", file_id)
+
+
+def _start_pending_drain() -> None:
+    """Hand queued transcriptions to workers from a background thread."""
+    threading.Thread(
+        target=process_pending_transcriptions,
+        daemon=True,
+        name="pending-drain",
+    ).start()
 
 
 def process_pending_transcriptions() -> None:
     """Process all pending transcription requests after model is ready."""
     pending = get_pending_transcriptions()
     if pending:
-        print(f"Processing {len(pending)} pending transcription request(s)...")
-        
-        # Import here to avoid circular imports
-        from ..api.transcription import transcribe_task
+        logger.info("Processing %d pending transcription request(s)", len(pending))
 
+        entries: "queue.SimpleQueue[dict]" = queue.SimpleQueue()
         for entry in pending:
-            file_id = entry["file_id"]
-            include_diarization = entry.get("include_diarization", True)
-            model_size = entry.get("model_size")
-            language = entry.get("language")
-            force_restart = entry.get("force_restart", False)
+            entries.put(entry)
+
+        # A bounded number of daemon workers drain the queue, so a large backlog does not
+        # start every transcription at once against the single loaded model.
+        worker_count = min(len(pending), max(1, settings.WHISPER_TRANSCRIBE_CONCURRENCY))
+        for index in range(worker_count):
             try:
-                print(f"Starting transcription for file {file_id}")
-                # Create a new thread for each transcription to avoid blocking
-                import threading
-                thread = threading.Thread(
-                    target=transcribe_task, 
-                    kwargs={
-                        "audio_file_id": file_id,
-                        "include_diarization": include_diarization,
-                        "model_size": model_size,
-                        "language": language,
-                        "force_restart": force_restart,
-                    },
-                    daemon=True
-                )
-                thread.start()
-            except Exception as e:
-                print(f"Failed to start transcription for file {file_id}: {e}")
+                threading.Thread(
+                    target=_run_pending_transcriptions,
+                    args=(entries,),
+                    daemon=True,
+                    name=f"transcribe-{index}",
+                ).start()
+            except Exception:
+                logger.exception("Failed to start transcription worker %d", index)
     else:
-        print("No pending transcription requests to process after model initialization.")
+        logger.info("No pending transcription requests to process after model initialization")
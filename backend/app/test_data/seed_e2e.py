@@ -8,10 +8,13 @@ manually prepared databases.
 from __future__ import annotations
 
 import json
+import os
 import shutil
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Iterable
+from typing import Any, Dict, List, Iterable
+
+from sqlalchemy import insert
 
 from ..core.config import settings
 from ..core.database import SessionLocal
@@ -24,31 +27,63 @@ from ..models.speaker import Speaker
 SEED_PROJECT_NAME = "E2E Sample Project"
 
 
-def _copy_asset(source: Path, target: Path) -> None:
+def _seed_metadata(note: str) -> str:
+    """Serialize transcription metadata shared by all seeded files."""
+    return json.dumps(
+        {
+            "source": "seed",
+            "note": note,
+            "model_size": "small",
+            "language": "en",
+            "include_diarization": True,
+        }
+    )
+
+
+# Seed JSON blobs are constant; serialize them once at import.
+_SEED_STATS = json.dumps({"seed": True})
+_SEED_STATS_RECAP = json.dumps({"seed": True, "segments": 5})
+_COMPLETED_INTERVIEW_METADATA = _seed_metadata("Completed interview with diarization")
+_COMPLETED_RECAP_METADATA = _seed_metadata("Completed demo recap")
+_PENDING_METADATA = _seed_metadata("Awaiting transcription")
+
+
+def _copy_asset(source: Path, target: Path) -> int:
     """
     Ensure the seed audio exists in the storage directory.
 
     Args:
         source: Path to the source asset.
         target: Destination path inside storage.
+
+    Returns:
+        Size of the stored asset in bytes.
     """
     target.parent.mkdir(parents=True, exist_ok=True)
-    if target.exists():
-        return
+    try:
+        return target.stat().st_size
+    except FileNotFoundError:
+        pass
 
     if not source.exists():
         # Create an empty placeholder so routes that stream audio succeed.
         target.write_bytes(b"")
-        return
+        return 0
 
-    shutil.copyfile(source, target)
+    try:
+        # Same filesystem: a hard link stores the asset without copying any bytes.
+        os.link(source, target)
+    except OSError:
+        # shutil.copyfile already uses the kernel fast-copy path (sendfile/fcopyfile) where available.
+        shutil.copyfile(source, target)
+    return target.stat().st_size
 
 
 def _create_segments(
     audio_file_id: int,
     speakers: Iterable[Speaker],
-) -> List[Segment]:
-    """Build a consistent transcript for seeded completed files."""
+) -> List[Dict[str, Any]]:
+    """Build segment rows for a consistent transcript on seeded completed files."""
     speaker_cycle = list(speakers)
     if not speaker_cycle:
         speaker_cycle = [None]
@@ -62,20 +97,21 @@ def _create_segments(
         (36.0, 44.5, "Perfect, I'll follow up with documentation after this call."),
     ]
 
-    segments: List[Segment] = []
-    for index, (start, end, text) in enumerate(base_lines, start=1):
-        speaker = speaker_cycle[(index - 1) % len(speaker_cycle)]
-        segments.append(
-            Segment(
-                audio_file_id=audio_file_id,
-                speaker_id=speaker.id if isinstance(speaker, Speaker) else None,
-                start_time=start,
-                end_time=end,
-                original_text=text,
-                edited_text=text,
-                sequence=index,
-            )
-        )
+    speaker_count = len(speaker_cycle)
+    line_count = len(base_lines)
+    segments: List[Dict[str, Any]] = [None] * line_count  # type: ignore[list-item]
+    for i in range(line_count):
+        start, end, text = base_lines[i]
+        speaker = speaker_cycle[i % speaker_count]
+        segments[i] = {
+            "audio_file_id": audio_file_id,
+            "speaker_id": speaker.id if isinstance(speaker, Speaker) else None,
+            "start_time": start,
+            "end_time": end,
+            "original_text": text,
+            "edited_text": text,
+            "sequence": i + 1,
+        }
     return segments
 
 
@@ -130,14 +166,14 @@ def seed_e2e_data() -> None:
         # Completed file #1
         completed_one_src = seed_assets / "assets" / "Kaartintorpantie-clip.m4a"
         completed_one_path = storage_root / "e2e-completed-01.m4a"
-        _copy_asset(completed_one_src, completed_one_path)
+        completed_one_size = _copy_asset(completed_one_src, completed_one_path)
 
         completed_one = AudioFile(
             project_id=project.id,
             filename=completed_one_path.name,
             original_filename="Quarterly Planning.m4a",
             file_path=str(completed_one_path),
-            file_size=completed_one_path.stat().st_size if completed_one_path.exists() else 0,
+            file_size=completed_one_size,
             duration=45.0,
             format="m4a",
             language="en",
@@ -148,7 +184,7 @@ def seed_e2e_data() -> None:
             transcription_completed_at=now - timedelta(minutes=16),
             transcription_duration_seconds=120.0,
             model_used="small",
-            processing_stats=json.dumps({"seed": True}),
+            processing_stats=_SEED_STATS,
             audio_transformed=True,
             audio_transformation_path=None,
             whisper_model_loaded="small",
@@ -156,15 +192,7 @@ def seed_e2e_data() -> None:
             last_processed_segment=6,
             processing_checkpoint=None,
             resume_token=None,
-            transcription_metadata=json.dumps(
-                {
-                    "source": "seed",
-                    "note": "Completed interview with diarization",
-                    "model_size": "small",
-                    "language": "en",
-                    "include_diarization": True,
-                }
-            ),
+            transcription_metadata=_COMPLETED_INTERVIEW_METADATA,
             interruption_count=0,
             last_error_at=None,
             recovery_attempts=0,
@@ -172,19 +200,19 @@ def seed_e2e_data() -> None:
         session.add(completed_one)
         session.flush()
 
-        session.add_all(_create_segments(completed_one.id, [speaker_alex, speaker_jordan]))
+        segment_rows = _create_segments(completed_one.id, [speaker_alex, speaker_jordan])
 
         # Completed file #2
         completed_two_src = seed_assets / "test-data" / "test-audio-30s.mp3"
         completed_two_path = storage_root / "e2e-completed-02.mp3"
-        _copy_asset(completed_two_src, completed_two_path)
+        completed_two_size = _copy_asset(completed_two_src, completed_two_path)
 
         completed_two = AudioFile(
             project_id=project.id,
             filename=completed_two_path.name,
             original_filename="Product Demo Recap.mp3",
             file_path=str(completed_two_path),
-            file_size=completed_two_path.stat().st_size if completed_two_path.exists() else 0,
+            file_size=completed_two_size,
             duration=30.0,
             format="mp3",
             language="en",
@@ -195,7 +223,7 @@ def seed_e2e_data() -> None:
             transcription_completed_at=now - timedelta(minutes=13),
             transcription_duration_seconds=90.0,
             model_used="small",
-            processing_stats=json.dumps({"seed": True, "segments": 5}),
+            processing_stats=_SEED_STATS_RECAP,
             audio_transformed=True,
             audio_transformation_path=None,
             whisper_model_loaded="small",
@@ -203,15 +231,7 @@ def seed_e2e_data() -> None:
             last_processed_segment=6,
             processing_checkpoint=None,
             resume_token=None,
-            transcription_metadata=json.dumps(
-                {
-                    "source": "seed",
-                    "note": "Completed demo recap",
-                    "model_size": "small",
-                    "language": "en",
-                    "include_diarization": True,
-                }
-            ),
+            transcription_metadata=_COMPLETED_RECAP_METADATA,
             interruption_count=0,
             last_error_at=None,
             recovery_attempts=0,
@@ -219,19 +239,21 @@ def seed_e2e_data() -> None:
         session.add(completed_two)
         session.flush()
 
-        session.add_all(_create_segments(completed_two.id, [speaker_jordan, speaker_alex]))
+        segment_rows += _create_segments(completed_two.id, [speaker_jordan, speaker_alex])
+        # One executemany INSERT for all seeded segments instead of per-object ORM flushes
+        session.execute(insert(Segment), segment_rows)
 
         # Pending file awaiting transcription
         pending_src = seed_assets / "test-data" / "test-audio-30s.mp3"
         pending_path = storage_root / "e2e-pending-01.mp3"
-        _copy_asset(pending_src, pending_path)
+        pending_size = _copy_asset(pending_src, pending_path)
 
         pending_file = AudioFile(
             project_id=project.id,
             filename=pending_path.name,
             original_filename="Team Sync.mp3",
             file_path=str(pending_path),
-            file_size=pending_path.stat().st_size if pending_path.exists() else 0,
+            file_size=pending_size,
             duration=30.0,
             format="mp3",
             language="en",
@@ -250,15 +272,7 @@ def seed_e2e_data() -> None:
             last_processed_segment=0,
             processing_checkpoint=None,
             resume_token=None,
-            transcription_metadata=json.dumps(
-                {
-                    "source": "seed",
-                    "note": "Awaiting transcription",
-                    "model_size": "small",
-                    "language": "en",
-                    "include_diarization": True,
-                }
-            ),
+            transcription_metadata=_PENDING_METADATA,
             interruption_count=0,
             last_error_at=None,
             recovery_attempts=0,
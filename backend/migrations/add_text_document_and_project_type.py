@@ -1,47 +1,61 @@
 import logging
-from sqlalchemy import text
+from sqlalchemy import inspect, text
 from sqlalchemy.engine import Engine
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Statements are built once at import and reused by every upgrade/downgrade run
+_CREATE_TEXT_DOCUMENTS = text("""
+    CREATE TABLE text_documents (
+        id SERIAL PRIMARY KEY,
+        project_id INTEGER NOT NULL UNIQUE,
+        content TEXT NOT NULL DEFAULT '',
+        history TEXT NOT NULL DEFAULT '[]',
+        created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+        updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+        FOREIGN KEY(project_id) REFERENCES projects(id)
+    );
+""")
+_ADD_PROJECT_TYPE = text("""
+    ALTER TABLE projects
+    ADD COLUMN project_type VARCHAR(50) NOT NULL DEFAULT 'audio';
+""")
+_DROP_TEXT_DOCUMENTS = text("DROP TABLE IF EXISTS text_documents;")
+_DROP_PROJECT_TYPE = text("ALTER TABLE projects DROP COLUMN IF EXISTS project_type;")
+
 def upgrade(engine: Engine):
     """
     Apply the migration:
     1. Create the 'text_documents' table.
     2. Add the 'project_type' column to the 'projects' table.
+
+    Existing tables/columns are detected up front, so the migration can be
+    re-run safely; everything else is applied in a single transaction.
     """
     logger.info("Applying migration: add_text_document_and_project_type")
 
-    with engine.connect() as connection:
-        try:
-            with connection.begin():
-                logger.info("Creating 'text_documents' table...")
-                connection.execute(text("""
-                    CREATE TABLE text_documents (
-                        id SERIAL PRIMARY KEY,
-                        project_id INTEGER NOT NULL UNIQUE,
-                        content TEXT NOT NULL DEFAULT '',
-                        history TEXT NOT NULL DEFAULT '[]',
-                        created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
-                        updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
-                        FOREIGN KEY(project_id) REFERENCES projects(id)
-                    );
-                """))
-                logger.info("'text_documents' table created successfully.")
+    with engine.begin() as connection:
+        inspector = inspect(connection)
+        has_text_documents = inspector.has_table("text_documents")
+        project_columns = {column["name"] for column in inspector.get_columns("projects")}
+
+        if has_text_documents:
+            logger.info("'text_documents' table already exists, skipping.")
+        else:
+            logger.info("Creating 'text_documents' table...")
+            connection.execute(_CREATE_TEXT_DOCUMENTS)
+            logger.info("'text_documents' table created successfully.")
 
-                logger.info("Adding 'project_type' column to 'projects' table...")
-                connection.execute(text("""
-                    ALTER TABLE projects
-                    ADD COLUMN project_type VARCHAR(50) NOT NULL DEFAULT 'audio';
-                """))
-                logger.info("'project_type' column added successfully.")
+        if "project_type" in project_columns:
+            logger.info("'project_type' column already exists, skipping.")
+        else:
+            logger.info("Adding 'project_type' column to 'projects' table...")
+            connection.execute(_ADD_PROJECT_TYPE)
+            logger.info("'project_type' column added successfully.")
 
-            logger.info("Migration applied successfully.")
-        except Exception as e:
-            logger.error(f"Error applying migration: {e}")
-            raise
+    logger.info("Migration applied successfully.")
 
 def downgrade(engine: Engine):
     """
@@ -51,18 +65,13 @@ def downgrade(engine: Engine):
     """
     logger.info("Reverting migration: add_text_document_and_project_type")
 
-    with engine.connect() as connection:
-        try:
-            with connection.begin():
-                logger.info("Dropping 'text_documents' table...")
-                connection.execute(text("DROP TABLE IF EXISTS text_documents;"))
-                logger.info("'text_documents' table dropped successfully.")
+    with engine.begin() as connection:
+        logger.info("Dropping 'text_documents' table...")
+        connection.execute(_DROP_TEXT_DOCUMENTS)
+        logger.info("'text_documents' table dropped successfully.")
 
-                logger.info("Removing 'project_type' column from 'projects' table...")
-                connection.execute(text("ALTER TABLE projects DROP COLUMN IF EXISTS project_type;"))
-                logger.info("'project_type' column removed successfully.")
+        logger.info("Removing 'project_type' column from 'projects' table...")
+        connection.execute(_DROP_PROJECT_TYPE)
+        logger.info("'project_type' column removed successfully.")
 
-            logger.info("Migration reverted successfully.")
-        except Exception as e:
-            logger.error(f"Error reverting migration: {e}")
-            raise
\ No newline at end of file
+    logger.info("Migration reverted successfully.")
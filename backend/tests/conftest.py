@@ -28,12 +28,16 @@ def pytest_configure(config):
 """
 Test configuration and fixtures.
 """
+import struct
 import sys
 from types import SimpleNamespace
 
+import httpx
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.dialects.sqlite import dialect as sqlite_dialect
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateIndex, CreateTable
 from fastapi.testclient import TestClient
 import tempfile
 import os
@@ -45,80 +49,57 @@ if "whisper" not in sys.modules:
 if "magic" not in sys.modules:
     sys.modules["magic"] = SimpleNamespace(from_buffer=lambda *args, **kwargs: "audio/wav")
 
-if "pydub" not in sys.modules:
-    class _DummyAudioSegment:
-        def __init__(self, duration_ms: int = 60000):
-            self._duration_ms = max(duration_ms, 0)
-            self.channels = 2  # Add missing attributes
-            self.frame_rate = 44100
-
-        @classmethod
-        def from_file(cls, *_args, **_kwargs):
-            # Simulate 1 minute duration audio by default
-            return cls(duration_ms=60000)
-
-        @staticmethod
-        def silent(duration: int = 1000):
-            return _DummyAudioSegment(duration_ms=duration)
-
-        def set_channels(self, *_args, **_kwargs):
-            return self
-
-        def set_frame_rate(self, *_args, **_kwargs):
-            return self
-
-        def export(self, buffer, *_args, **_kwargs):
-            if hasattr(buffer, "write"):
-                # Write actual WAV header + minimal data for tests
-                wav_header = (
-                    b'RIFF' +
-                    (1044).to_bytes(4, 'little') +  # File size
-                    b'WAVE' +
-                    b'fmt ' +
-                    (16).to_bytes(4, 'little') +    # Format chunk size
-                    (1).to_bytes(2, 'little') +     # Audio format (PCM)
-                    (2).to_bytes(2, 'little') +     # Number of channels
-                    (44100).to_bytes(4, 'little') + # Sample rate
-                    (176400).to_bytes(4, 'little') + # Byte rate
-                    (4).to_bytes(2, 'little') +     # Block align
-                    (16).to_bytes(2, 'little') +    # Bits per sample
-                    b'data' +
-                    (1000).to_bytes(4, 'little')    # Data chunk size
-                )
-                buffer.write(wav_header)
-                buffer.write(b"\x00" * 1000)  # Audio data
-            elif isinstance(buffer, str):
-                # Write to file path
-                with open(buffer, 'wb') as f:
-                    wav_header = (
-                        b'RIFF' +
-                        (1044).to_bytes(4, 'little') +
-                        b'WAVE' +
-                        b'fmt ' +
-                        (16).to_bytes(4, 'little') +
-                        (1).to_bytes(2, 'little') +
-                        (2).to_bytes(2, 'little') +
-                        (44100).to_bytes(4, 'little') +
-                        (176400).to_bytes(4, 'little') +
-                        (4).to_bytes(2, 'little') +
-                        (16).to_bytes(2, 'little') +
-                        b'data' +
-                        (1000).to_bytes(4, 'little')
-                    )
-                    f.write(wav_header)
-                    f.write(b"\x00" * 1000)
-            return None
-
-        def __len__(self):
-            return self._duration_ms
-
-        def __getitem__(self, item):
-            if isinstance(item, slice):
-                start = item.start or 0
-                stop = item.stop if item.stop is not None else self._duration_ms
-                return _DummyAudioSegment(duration_ms=max(stop - start, 0))
-            raise TypeError("AudioSegment slices must be slice objects")
+# Minimal WAV (stereo, 44.1 kHz PCM header + 1000 bytes of silence) written by the pydub stub
+_STUB_EXPORT_WAV = struct.pack(
+    "<4sI4s4sIHHIIHH4sI",
+    b"RIFF", 1044, b"WAVE",
+    b"fmt ", 16, 1, 2, 44100, 176400, 4, 16,
+    b"data", 1000,
+) + bytes(1000)
+
+
+class _DummyAudioSegment:
+    def __init__(self, duration_ms: int = 60000):
+        self._duration_ms = max(duration_ms, 0)
+        self.channels = 2  # Add missing attributes
+        self.frame_rate = 44100
+
+    @classmethod
+    def from_file(cls, *_args, **_kwargs):
+        # Simulate 1 minute duration audio by default
+        return cls(duration_ms=60000)
+
+    @staticmethod
+    def silent(duration: int = 1000):
+        return _DummyAudioSegment(duration_ms=duration)
+
+    def set_channels(self, *_args, **_kwargs):
+        return self
+
+    def set_frame_rate(self, *_args, **_kwargs):
+        return self
+
+    def export(self, buffer, *_args, **_kwargs):
+        if hasattr(buffer, "write"):
+            buffer.write(_STUB_EXPORT_WAV)
+        elif isinstance(buffer, str):
+            # Write to file path
+            with open(buffer, 'wb') as f:
+                f.write(_STUB_EXPORT_WAV)
+        return None
+
+    def __len__(self):
+        return self._duration_ms
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            start = item.start or 0
+            stop = item.stop if item.stop is not None else self._duration_ms
+            return _DummyAudioSegment(duration_ms=max(stop - start, 0))
+        raise TypeError("AudioSegment slices must be slice objects")
 
+
+if "pydub" not in sys.modules:
     sys.modules["pydub"] = SimpleNamespace(AudioSegment=_DummyAudioSegment)
 
 if "pyannote.audio" not in sys.modules:
@@ -154,9 +135,12 @@ if "torch" not in sys.modules:
         set_num_threads=_set_num_threads,
     )
 
+from fastapi import FastAPI
 from app.main import app as fastapi_app
+from app.api import ai_corrections, ai_editor
 from app.core import database as app_database
 from app.core.database import get_db
+from app.services.transcription_singleton import cleanup_transcription_service
 from app.models.base import Base
 from app.models.project import Project
 from app.models.audio_file import AudioFile, TranscriptionStatus
@@ -164,47 +148,80 @@ from app.models.segment import Segment
 from app.models.speaker import Speaker
 
 
-# Test database URL (in-memory SQLite with shared cache for multiple connections)
-# Using a unique name per test ensures complete isolation
-import uuid
+# Schema DDL compiled once from the models (tables in dependency order, then their indexes)
+_SCHEMA_SQL = ";\n".join(
+    str(ddl.compile(dialect=sqlite_dialect())).strip()
+    for table in Base.metadata.sorted_tables
+    for ddl in (CreateTable(table), *(CreateIndex(index) for index in table.indexes))
+) + ";"
 
 
-@pytest.fixture(scope="function")
-def test_engine():
-    """Create a test database engine with unique name for isolation."""
-    # Use file-based SQLite with unique name for proper isolation
-    db_name = f"/tmp/test_{uuid.uuid4().hex}.db"
-    test_db_url = f"sqlite:///{db_name}"
+# Test database: one SQLite file per test session, schema created once.
+# A file (rather than an in-memory database) lets background transcription
+# threads open their own connections just like in production.
+import uuid
 
-    original_engine = app_database.engine
-    original_session_local = app_database.SessionLocal
 
+@pytest.fixture(scope="session")
+def _session_engine():
+    """Create the session-wide test engine and schema."""
+    db_name = os.path.join(tempfile.gettempdir(), f"test_{uuid.uuid4().hex}.db")
     engine = create_engine(
-        test_db_url,
+        f"sqlite:///{db_name}",
         connect_args={"check_same_thread": False},
         poolclass=None  # Disable connection pooling for tests
     )
+
+    @event.listens_for(engine, "connect")
+    def _set_test_pragmas(dbapi_conn, connection_record):
+        # Durability is irrelevant for throwaway test data: skip fsync and keep
+        # the rollback journal in memory. Locking stays shared because
+        # background transcription threads open their own connections.
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    # Raw executescript: one call instead of create_all's per-table reflection checks
+    raw_conn = engine.raw_connection()
+    try:
+        raw_conn.executescript(_SCHEMA_SQL)
+        raw_conn.commit()
+    finally:
+        raw_conn.close()
+
+    yield engine
+
+    engine.dispose()
+    if os.path.exists(db_name):
+        os.remove(db_name)
+
+
+@pytest.fixture(scope="function")
+def test_engine(_session_engine):
+    """Bind the application to the test database and empty it after each test."""
+    engine = _session_engine
+
+    original_engine = app_database.engine
+    original_session_local = app_database.SessionLocal
+
     # Rebind application session maker and engine to the test database
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     app_database.engine = engine
     app_database.SessionLocal = TestingSessionLocal
 
-    # Create tables
-    Base.metadata.create_all(bind=engine)
-
     yield engine
 
-    # Drop tables and clean up
-    Base.metadata.drop_all(bind=engine)
-    engine.dispose()
+    # Delete rows instead of rebuilding the schema; SQLite reuses rowids once
+    # a table is empty, so ids start from 1 again in the next test.
+    with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            conn.execute(table.delete())
     # Restore original application database bindings
     app_database.SessionLocal = original_session_local
     app_database.engine = original_engine
 
-    # Remove database file
-    if os.path.exists(db_name):
-        os.remove(db_name)
-
 
 @pytest.fixture(scope="function")
 def test_db(test_engine):
@@ -216,21 +233,29 @@ def test_db(test_engine):
         db.close()
 
 
-@pytest.fixture
-def client(test_db, monkeypatch):
-    """Create a test client with test database."""
+@pytest.fixture(scope="session")
+def _base_client(_session_engine):
+    """Enter the application lifespan once for the whole test session."""
+    # Run startup (init_db, status normalization, orphan cleanup) against the test database
+    original_engine = app_database.engine
+    original_session_local = app_database.SessionLocal
+    app_database.engine = _session_engine
+    app_database.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=_session_engine)
+    test_client = TestClient(fastapi_app)
+    try:
+        test_client.__enter__()
+    finally:
+        app_database.SessionLocal = original_session_local
+        app_database.engine = original_engine
+
+    yield test_client
 
-    # Prevent the app's startup lifecycle from running db initializations.
-    # The test setup already handles creating the test database and tables.
-    def do_nothing():
-        pass
+    test_client.__exit__(None, None, None)
 
-    # Only patch if these functions exist in app.main
-    import app.main
-    if hasattr(app.main, "init_db"):
-        monkeypatch.setattr("app.main.init_db", do_nothing)
-    if hasattr(app.main, "run_migrations"):
-        monkeypatch.setattr("app.main.run_migrations", do_nothing)
+
+@pytest.fixture
+def client(_base_client, test_db):
+    """Create a test client with test database."""
 
     def override_get_db():
         try:
@@ -239,10 +264,47 @@ def client(test_db, monkeypatch):
             pass
 
     fastapi_app.dependency_overrides[get_db] = override_get_db
+    _base_client.cookies.clear()
+
+    yield _base_client
 
-    with TestClient(fastapi_app) as test_client:
-        yield test_client
     fastapi_app.dependency_overrides.clear()
+    # Per-test equivalent of the lifespan shutdown hook
+    cleanup_transcription_service()
+
+
+@pytest.fixture(scope="session")
+def app_instance():
+    """The application, for tests that need it directly (e.g. dependency overrides)."""
+    return fastapi_app
+
+
+@pytest.fixture
+async def aclient(app_instance):
+    """Async client calling the app over ASGI in the test's own event loop."""
+    transport = httpx.ASGITransport(app=app_instance)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as async_client:
+        yield async_client
+
+
+def _build_router_app(*routers):
+    """Build a bare FastAPI app serving only the given routers (no middleware or lifespan)."""
+    stripped_app = FastAPI()
+    for router in routers:
+        stripped_app.include_router(router)
+    return stripped_app
+
+
+@pytest.fixture(scope="session")
+def ai_corrections_app():
+    """App with just the AI corrections router, for tests that need no other routes."""
+    return _build_router_app(ai_corrections.router)
+
+
+@pytest.fixture(scope="session")
+def ai_editor_app():
+    """App with just the AI editor router, for tests that need no other routes."""
+    return _build_router_app(ai_editor.router)
 
 
 @pytest.fixture(scope="function")
@@ -257,151 +319,129 @@ def temp_audio_dir():
         settings.AUDIO_STORAGE_PATH = original_path
 
 
+# Minimal mono 16 kHz PCM WAV: 44-byte header followed by 1000 bytes of silence
+_SAMPLE_WAV = struct.pack(
+    "<4sI4s4sIHHIIHH4sI",
+    b"RIFF", 36 + 1000, b"WAVE",
+    b"fmt ", 16, 1, 1, 16000, 32000, 2, 16,
+    b"data", 1000,
+) + bytes(1000)
+
+
 @pytest.fixture
 def sample_audio_content():
     """Generate minimal valid audio file content for testing."""
-    # Minimal WAV file header (44 bytes) + some data
-    # RIFF header
-    wav_header = b'RIFF'
-    wav_header += (36 + 1000).to_bytes(4, 'little')  # File size - 8
-    wav_header += b'WAVE'
-    # fmt chunk
-    wav_header += b'fmt '
-    wav_header += (16).to_bytes(4, 'little')  # fmt chunk size
-    wav_header += (1).to_bytes(2, 'little')   # audio format (PCM)
-    wav_header += (1).to_bytes(2, 'little')   # number of channels
-    wav_header += (16000).to_bytes(4, 'little')  # sample rate
-    wav_header += (32000).to_bytes(4, 'little')  # byte rate
-    wav_header += (2).to_bytes(2, 'little')   # block align
-    wav_header += (16).to_bytes(2, 'little')  # bits per sample
-    # data chunk
-    wav_header += b'data'
-    wav_header += (1000).to_bytes(4, 'little')  # data size
-    wav_header += b'\x00' * 1000  # audio data
-
-    return wav_header
+    return _SAMPLE_WAV
+
+
+def _bulk_insert(session, model, rows):
+    """Insert fixture rows in one bulk statement and return them as ORM objects."""
+    objects = session.scalars(insert(model).returning(model, sort_by_parameter_order=True), rows).all()
+    session.commit()
+    return objects
 
 
 @pytest.fixture
 def sample_project(test_db):
     """Create a sample project for testing."""
-    project = Project(
-        name="Test Project",
-        description="A test project for unit tests"
-    )
-    test_db.add(project)
-    test_db.commit()
-    test_db.refresh(project)
-    return project
+    # INSERT ... RETURNING hands back the row with its id; no refresh round-trip
+    return _bulk_insert(test_db, Project, [{
+        "name": "Test Project",
+        "description": "A test project for unit tests",
+    }])[0]
 
 
 @pytest.fixture
 def sample_audio_file(test_db, sample_project):
     """Create a sample audio file for testing."""
-    audio_file = AudioFile(
-        project_id=sample_project.id,
-        filename="test_audio.mp3",
-        original_filename="test_audio.mp3",
-        file_path="data/audio/test_audio.mp3",
-        file_size=1000,
-        duration=60.0,
-        format="mp3",
-        transcription_status=TranscriptionStatus.COMPLETED
-    )
-    test_db.add(audio_file)
-    test_db.commit()
-    test_db.refresh(audio_file)
-    return audio_file
+    return _bulk_insert(test_db, AudioFile, [{
+        "project_id": sample_project.id,
+        "filename": "test_audio.mp3",
+        "original_filename": "test_audio.mp3",
+        "file_path": "data/audio/test_audio.mp3",
+        "file_size": 1000,
+        "duration": 60.0,
+        "format": "mp3",
+        "transcription_status": TranscriptionStatus.COMPLETED,
+    }])[0]
 
 
 @pytest.fixture
 def sample_segments(test_db, sample_audio_file):
     """Create sample segments for testing."""
-    segments = [
-        Segment(
-            audio_file_id=sample_audio_file.id,
-            start_time=0.0,
-            end_time=10.0,
-            original_text="This is the first segment.",
-            sequence=0,
-            speaker_id=None,
-            is_passive=False,
-        ),
-        Segment(
-            audio_file_id=sample_audio_file.id,
-            start_time=10.0,
-            end_time=20.0,
-            original_text="This is the second segment.",
-            sequence=1,
-            speaker_id=None,
-            is_passive=False,
-        ),
-        Segment(
-            audio_file_id=sample_audio_file.id,
-            start_time=20.0,
-            end_time=30.0,
-            original_text="This is the third segment.",
-            sequence=2,
-            speaker_id=None,
-            is_passive=False,
-        )
-    ]
-    for seg in segments:
-        test_db.add(seg)
-    test_db.commit()
-    return segments
+    return _bulk_insert(test_db, Segment, [
+        {
+            "audio_file_id": sample_audio_file.id,
+            "start_time": 0.0,
+            "end_time": 10.0,
+            "original_text": "This is the first segment.",
+            "sequence": 0,
+            "speaker_id": None,
+            "is_passive": False,
+        },
+        {
+            "audio_file_id": sample_audio_file.id,
+            "start_time": 10.0,
+            "end_time": 20.0,
+            "original_text": "This is the second segment.",
+            "sequence": 1,
+            "speaker_id": None,
+            "is_passive": False,
+        },
+        {
+            "audio_file_id": sample_audio_file.id,
+            "start_time": 20.0,
+            "end_time": 30.0,
+            "original_text": "This is the third segment.",
+            "sequence": 2,
+            "speaker_id": None,
+            "is_passive": False,
+        },
+    ])
 
 
 @pytest.fixture
 def sample_segments_with_edits(test_db, sample_audio_file):
     """Create sample segments with edited text for testing."""
-    segments = [
-        Segment(
-            audio_file_id=sample_audio_file.id,
-            start_time=0.0,
-            end_time=10.0,
-            original_text="Original text segment one.",
-            edited_text="Edited text segment one.",
-            sequence=0,
-            is_passive=False,
-        ),
-        Segment(
-            audio_file_id=sample_audio_file.id,
-            start_time=10.0,
-            end_time=20.0,
-            original_text="Original text segment two.",
-            edited_text="Edited text segment two.",
-            sequence=1,
-            is_passive=False,
-        )
-    ]
-    for seg in segments:
-        test_db.add(seg)
-    test_db.commit()
-    return segments
+    return _bulk_insert(test_db, Segment, [
+        {
+            "audio_file_id": sample_audio_file.id,
+            "start_time": 0.0,
+            "end_time": 10.0,
+            "original_text": "Original text segment one.",
+            "edited_text": "Edited text segment one.",
+            "sequence": 0,
+            "is_passive": False,
+        },
+        {
+            "audio_file_id": sample_audio_file.id,
+            "start_time": 10.0,
+            "end_time": 20.0,
+            "original_text": "Original text segment two.",
+            "edited_text": "Edited text segment two.",
+            "sequence": 1,
+            "is_passive": False,
+        },
+    ])
 
 
 @pytest.fixture
 def sample_speakers(test_db, sample_project):
     """Create sample speakers for testing."""
-    speakers = [
-        Speaker(
-            project_id=sample_project.id,
-            speaker_id="SPEAKER_00",
-            display_name="Speaker 1",
-            color="#FF5733"
-        ),
-        Speaker(
-            project_id=sample_project.id,
-            speaker_id="SPEAKER_01",
-            display_name="Speaker 2",
-            color="#33FF57"
-        )
-    ]
-    for speaker in speakers:
-        test_db.add(speaker)
-    test_db.commit()
-    return speakers
+    return _bulk_insert(test_db, Speaker, [
+        {
+            "project_id": sample_project.id,
+            "speaker_id": "SPEAKER_00",
+            "display_name": "Speaker 1",
+            "color": "#FF5733",
+        },
+        {
+            "project_id": sample_project.id,
+            "speaker_id": "SPEAKER_01",
+            "display_name": "Speaker 2",
+            "color": "#33FF57",
+        },
+    ])
 
 
 @pytest.fixture(autouse=True)
@@ -415,80 +455,6 @@ def reset_pydub_after_real_tests():
         if hasattr(pydub_module, "AudioSegment") and hasattr(pydub_module.AudioSegment, "converter"):
             # Real pydub is loaded - we need to restore our dummy for normal tests
             
-            # Restore dummy pydub
-            class _DummyAudioSegment:
-                def __init__(self, duration_ms: int = 60000):
-                    self._duration_ms = max(duration_ms, 0)
-                    self.channels = 2  # Add missing attributes
-                    self.frame_rate = 44100
-
-                @classmethod
-                def from_file(cls, *_args, **_kwargs):
-                    # Simulate 1 minute duration audio by default
-                    return cls(duration_ms=60000)
-
-                @staticmethod
-                def silent(duration: int = 1000):
-                    return _DummyAudioSegment(duration_ms=duration)
-
-                def set_channels(self, *_args, **_kwargs):
-                    return self
-
-                def set_frame_rate(self, *_args, **_kwargs):
-                    return self
-
-                def export(self, buffer, *_args, **_kwargs):
-                    if hasattr(buffer, "write"):
-                        # Write actual WAV header + minimal data for tests
-                        wav_header = (
-                            b'RIFF' +
-                            (1044).to_bytes(4, 'little') +  # File size
-                            b'WAVE' +
-                            b'fmt ' +
-                            (16).to_bytes(4, 'little') +    # Format chunk size
-                            (1).to_bytes(2, 'little') +     # Audio format (PCM)
-                            (2).to_bytes(2, 'little') +     # Number of channels
-                            (44100).to_bytes(4, 'little') + # Sample rate
-                            (176400).to_bytes(4, 'little') + # Byte rate
-                            (4).to_bytes(2, 'little') +     # Block align
-                            (16).to_bytes(2, 'little') +    # Bits per sample
-                            b'data' +
-                            (1000).to_bytes(4, 'little')    # Data chunk size
-                        )
-                        buffer.write(wav_header)
-                        buffer.write(b"\x00" * 1000)  # Audio data
-                    elif isinstance(buffer, str):
-                        # Write to file path
-                        with open(buffer, 'wb') as f:
-                            wav_header = (
-                                b'RIFF' +
-                                (1044).to_bytes(4, 'little') +
-                                b'WAVE' +
-                                b'fmt ' +
-                                (16).to_bytes(4, 'little') +
-                                (1).to_bytes(2, 'little') +
-                                (2).to_bytes(2, 'little') +
-                                (44100).to_bytes(4, 'little') +
-                                (176400).to_bytes(4, 'little') +
-                                (4).to_bytes(2, 'little') +
-                                (16).to_bytes(2, 'little') +
-                                b'data' +
-                                (1000).to_bytes(4, 'little')
-                            )
-                            f.write(wav_header)
-                            f.write(b"\x00" * 1000)
-                    return None
-
-                def __len__(self):
-                    return self._duration_ms
-
-                def __getitem__(self, item):
-                    if isinstance(item, slice):
-                        start = item.start or 0
-                        stop = item.stop if item.stop is not None else self._duration_ms
-                        return _DummyAudioSegment(duration_ms=max(stop - start, 0))
-                    raise TypeError("AudioSegment slices must be slice objects")
-            
             # Replace real pydub with dummy
             sys.modules["pydub"] = SimpleNamespace(AudioSegment=_DummyAudioSegment)
             
@@ -6,154 +6,14 @@ DO NOT stub anything here - tests should use actual implementations.
 """
 import sys
 import os
-
-# CRITICAL: Remove parent conftest stubs and load real modules
-# Parent conftest runs FIRST and creates stubs in sys.modules
-# We must DELETE those stubs BEFORE importing real modules
-
-print("[tests/real/conftest.py] Removing parent conftest stubs...")
-print(f"Before removal - 'whisper' in sys.modules: {'whisper' in sys.modules}")
-print(f"Before removal - 'torch' in sys.modules: {'torch' in sys.modules}")
-
-# DELETE the stubs created by parent conftest
-stubbed_modules = ["whisper", "torch", "pydub", "magic", "pyannote", "pyannote.audio"]
-for module_name in stubbed_modules:
-    if module_name in sys.modules:
-        print(f"Removing stub: {module_name}")
-        del sys.modules[module_name]
-
-print("Loading REAL modules...")
-
-# NOW import the real modules (Python will load them since they're no longer in sys.modules)
-import pydub
-import magic
-import whisper
-import torch
-
-print(f"Real whisper module loaded: {type(whisper)} - has load_model: {hasattr(whisper, 'load_model')}")
-print(f"Real torch module loaded: {type(torch)} - has cuda: {hasattr(torch, 'cuda')}")
-
-# Force real modules into sys.modules
-sys.modules["pydub"] = pydub
-sys.modules["magic"] = magic
-sys.modules["whisper"] = whisper
-sys.modules["torch"] = torch
-
-print("[tests/real/conftest.py] Real modules installed in sys.modules")
-
-# CRITICAL: Reload modules that may have imported the stubs at module load time
-# This ensures they re-import the REAL modules instead of using cached stubs
+import functools
 import importlib
-if "app.services.audio_service" in sys.modules:
-    print("Reloading audio_service to pick up real pydub")
-    import app.services.audio_service
-    importlib.reload(app.services.audio_service)
-    
-    # CRITICAL: Force FFmpeg configuration GLOBALLY for REAL pydub
-    print("FORCING GLOBAL FFmpeg configuration for ALL real test AudioSegment instances")
-    from pydub import AudioSegment
-    import shutil
-    import os
-    
-    # Find FFmpeg paths manually - ALL PLATFORMS
-    ffmpeg_paths = [
-        # macOS paths
-        '/opt/homebrew/bin/ffmpeg',  # macOS Homebrew ARM
-        '/usr/local/bin/ffmpeg',     # macOS Homebrew Intel
-        
-        # Linux paths
-        '/usr/bin/ffmpeg',           # Linux system package
-        '/usr/local/bin/ffmpeg',     # Linux manual install
-        
-        # Windows paths
-        'C:\\ffmpeg\\bin\\ffmpeg.exe',              # Common Windows install
-        'C:\\Program Files\\ffmpeg\\bin\\ffmpeg.exe', # Program Files
-        'C:\\Program Files (x86)\\ffmpeg\\bin\\ffmpeg.exe', # x86 Program Files
-        'ffmpeg.exe',                # Windows PATH with .exe
-        
-        # Cross-platform system PATH
-        shutil.which('ffmpeg')       # System PATH (all platforms)
-    ]
-    
-    ffprobe_paths = [
-        # macOS paths
-        '/opt/homebrew/bin/ffprobe',  # macOS Homebrew ARM
-        '/usr/local/bin/ffprobe',     # macOS Homebrew Intel
-        
-        # Linux paths
-        '/usr/bin/ffprobe',           # Linux system package
-        '/usr/local/bin/ffprobe',     # Linux manual install
-        
-        # Windows paths
-        'C:\\ffmpeg\\bin\\ffprobe.exe',              # Common Windows install
-        'C:\\Program Files\\ffmpeg\\bin\\ffprobe.exe', # Program Files
-        'C:\\Program Files (x86)\\ffmpeg\\bin\\ffprobe.exe', # x86 Program Files
-        'ffprobe.exe',                # Windows PATH with .exe
-        
-        # Cross-platform system PATH
-        shutil.which('ffprobe')       # System PATH (all platforms)
-    ]
-    
-    ffmpeg_path = None
-    for path in ffmpeg_paths:
-        if path and os.path.isfile(path) and os.access(path, os.X_OK):
-            ffmpeg_path = path
-            break
-            
-    ffprobe_path = None
-    for path in ffprobe_paths:
-        if path and os.path.isfile(path) and os.access(path, os.X_OK):
-            ffprobe_path = path
-            break
-    
-    if ffmpeg_path and ffprobe_path:
-        # FORCE GLOBAL AudioSegment configuration
-        AudioSegment.converter = ffmpeg_path
-        AudioSegment.ffmpeg = ffmpeg_path  
-        AudioSegment.ffprobe = ffprobe_path
-        
-        # MONKEY PATCH the AudioSegment class to ALWAYS use our paths
-        original_init = AudioSegment.__init__
-        def patched_init(self, *args, **kwargs):
-            result = original_init(self, *args, **kwargs)
-            # Ensure our FFmpeg paths are ALWAYS set
-            AudioSegment.converter = ffmpeg_path
-            AudioSegment.ffmpeg = ffmpeg_path
-            AudioSegment.ffprobe = ffprobe_path
-            return result
-        AudioSegment.__init__ = patched_init
-        
-        print(f"REAL TEST FFmpeg GLOBALLY configured and MONKEY-PATCHED: {ffmpeg_path}, ffprobe: {ffprobe_path}")
-        
-        # FORCE PATH ENVIRONMENT WITH FFmpeg FOR REAL TEST
-        ffmpeg_dirs = [
-            "/opt/homebrew/bin",  # Homebrew ARM Mac
-            "/usr/local/bin",     # Homebrew Intel Mac  
-            "/usr/bin",           # Linux system
-            "/bin"                # Linux fallback
-        ]
-        current_path = os.environ.get('PATH', '')
-        for ffmpeg_dir in ffmpeg_dirs:
-            if ffmpeg_dir not in current_path:
-                current_path = f"{ffmpeg_dir}:{current_path}"
-        os.environ['PATH'] = current_path
-        print(f"REAL TEST PATH FORCED: {os.environ['PATH'][:200]}...")
-    else:
-        print(f"REAL TEST FFmpeg auto-detection FAILED: ffmpeg={ffmpeg_path}, ffprobe={ffprobe_path}")
-        raise RuntimeError("FFmpeg/ffprobe not found for real tests!")
-
-if "app.services.transcription_service" in sys.modules:
-    print("Reloading transcription_service to pick up reloaded audio_service")
-    import app.services.transcription_service
-    importlib.reload(app.services.transcription_service)
-
-# NOW we can continue with other imports
+from pathlib import Path
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
-import tempfile
 
 # Import from parent conftest for shared fixtures
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
@@ -161,59 +21,256 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 from app.main import app as fastapi_app
 from app.core.database import get_db
 from app.models.base import Base
-from app.models.project import Project
 from app.models.audio_file import AudioFile, TranscriptionStatus
 
 
-@pytest.fixture(scope="function")
-def test_db():
-    """Create a test database for each test."""
-    # Use a TEMP FILE database instead of :memory: to allow sharing between threads
-    # SQLite :memory: databases are per-connection and don't share data between threads
-    import tempfile
-    import os
+# Modules the parent conftest replaces with lightweight stubs
+stubbed_modules = ("whisper", "torch", "pydub", "magic", "pyannote", "pyannote.audio")
+
+
+def _swap_stubs(names):
+    """Pop the named stubs from sys.modules in one pass and return what was removed."""
+    modules = sys.modules
+    return {name: modules.pop(name) for name in names if name in modules}
+
+
+def _modules_bound_to_stubs(stubs):
+    """Return names of app modules whose globals still reference a stub or its members."""
+    stub_ids = set()
+    for stub in stubs:
+        stub_ids.add(id(stub))
+        stub_ids.update(id(value) for value in vars(stub).values() if callable(value))
+    return {
+        name
+        for name, module in list(sys.modules.items())
+        if name.startswith("app.") and module is not None
+        and any(id(value) in stub_ids for value in vars(module).values())
+    }
+
 
-    # Create a temporary database file
-    db_fd, db_path = tempfile.mkstemp(suffix='.db')
-    os.close(db_fd)
+def _install_real_modules():
+    """Swap the parent conftest stubs for the real modules and re-point app code at them."""
+    # CRITICAL: Remove parent conftest stubs and load real modules
+    # Parent conftest runs FIRST and creates stubs in sys.modules
+    # We must DELETE those stubs BEFORE importing real modules
 
+    print("[tests/real/conftest.py] Removing parent conftest stubs...")
+    print(f"Before removal - 'whisper' in sys.modules: {'whisper' in sys.modules}")
+    print(f"Before removal - 'torch' in sys.modules: {'torch' in sys.modules}")
+
+    removed_stubs = _swap_stubs(stubbed_modules)
+    for module_name in removed_stubs:
+        print(f"Removing stub: {module_name}")
+
+    print("Loading REAL modules...")
+
+    # NOW import the real modules (Python will load them since they're no longer in sys.modules)
     try:
-        # Use check_same_thread=False to allow database access from background threads
-        engine = create_engine(
-            f"sqlite:///{db_path}",
-            connect_args={"check_same_thread": False},
-            poolclass=StaticPool,  # Use StaticPool for thread-safe database
-        )
-        Base.metadata.create_all(bind=engine)
-        TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-        # Store engine and sessionmaker in app state so background threads can access it
-        fastapi_app.state.test_engine = engine
-        fastapi_app.state.test_sessionmaker = TestingSessionLocal
-
-        # CRITICAL: Override the global SessionLocal used by transcribe_task
-        # transcribe_task creates its own session via SessionLocal() instead of using dependency injection
-        import app.core.database as db_module
-        original_session_local = db_module.SessionLocal
-        db_module.SessionLocal = TestingSessionLocal
-
-        db = TestingSessionLocal()
-        try:
-            yield db
-        finally:
-            db.close()
-            # Restore original SessionLocal
-            db_module.SessionLocal = original_session_local
-            engine.dispose()
-    finally:
-        # Clean up the temporary database file
-        if os.path.exists(db_path):
-            os.unlink(db_path)
+        real_modules = {name: pytest.importorskip(name) for name in ("pydub", "magic", "whisper", "torch")}
+    except pytest.skip.Exception:
+        # Put the stubs back so the rest of the session keeps working without real dependencies
+        sys.modules.update(removed_stubs)
+        raise
+    whisper = real_modules["whisper"]
+    torch = real_modules["torch"]
+
+    print(f"Real whisper module loaded: {type(whisper)} - has load_model: {hasattr(whisper, 'load_model')}")
+    print(f"Real torch module loaded: {type(torch)} - has cuda: {hasattr(torch, 'cuda')}")
+
+    # Force real modules into sys.modules
+    sys.modules.update(real_modules)
+
+    print("[tests/real/conftest.py] Real modules installed in sys.modules")
+
+    # CRITICAL: Reload modules that may have imported the stubs at module load time
+    # This ensures they re-import the REAL modules instead of using cached stubs
+    # Only entries that the real imports replaced were stubs; walk sys.modules once for their users
+    stale_modules = _modules_bound_to_stubs(
+        stub for name, stub in removed_stubs.items() if sys.modules.get(name) is not stub
+    )
+
+    if "app.services.audio_service" in sys.modules:
+        if "app.services.audio_service" in stale_modules:
+            print("Reloading audio_service to pick up real pydub")
+            importlib.reload(sys.modules["app.services.audio_service"])
+            # transcription_service holds AudioService from the module we just replaced
+            stale_modules.add("app.services.transcription_service")
+
+        # CRITICAL: Force FFmpeg configuration GLOBALLY for REAL pydub
+        print("FORCING GLOBAL FFmpeg configuration for ALL real test AudioSegment instances")
+        from pydub import AudioSegment
+        import shutil
+
+        # Find FFmpeg paths manually - ALL PLATFORMS
+        ffmpeg_paths = [
+            # macOS paths
+            '/opt/homebrew/bin/ffmpeg',  # macOS Homebrew ARM
+            '/usr/local/bin/ffmpeg',     # macOS Homebrew Intel
+
+            # Linux paths
+            '/usr/bin/ffmpeg',           # Linux system package
+            '/usr/local/bin/ffmpeg',     # Linux manual install
+
+            # Windows paths
+            'C:\\ffmpeg\\bin\\ffmpeg.exe',              # Common Windows install
+            'C:\\Program Files\\ffmpeg\\bin\\ffmpeg.exe', # Program Files
+            'C:\\Program Files (x86)\\ffmpeg\\bin\\ffmpeg.exe', # x86 Program Files
+            'ffmpeg.exe',                # Windows PATH with .exe
+
+            # Cross-platform system PATH
+            shutil.which('ffmpeg')       # System PATH (all platforms)
+        ]
+
+        ffprobe_paths = [
+            # macOS paths
+            '/opt/homebrew/bin/ffprobe',  # macOS Homebrew ARM
+            '/usr/local/bin/ffprobe',     # macOS Homebrew Intel
+
+            # Linux paths
+            '/usr/bin/ffprobe',           # Linux system package
+            '/usr/local/bin/ffprobe',     # Linux manual install
+
+            # Windows paths
+            'C:\\ffmpeg\\bin\\ffprobe.exe',              # Common Windows install
+            'C:\\Program Files\\ffmpeg\\bin\\ffprobe.exe', # Program Files
+            'C:\\Program Files (x86)\\ffmpeg\\bin\\ffprobe.exe', # x86 Program Files
+            'ffprobe.exe',                # Windows PATH with .exe
+
+            # Cross-platform system PATH
+            shutil.which('ffprobe')       # System PATH (all platforms)
+        ]
+
+        ffmpeg_path = None
+        for path in ffmpeg_paths:
+            if path and os.path.isfile(path) and os.access(path, os.X_OK):
+                ffmpeg_path = path
+                break
+
+        ffprobe_path = None
+        for path in ffprobe_paths:
+            if path and os.path.isfile(path) and os.access(path, os.X_OK):
+                ffprobe_path = path
+                break
+
+        if ffmpeg_path and ffprobe_path:
+            # FORCE GLOBAL AudioSegment configuration
+            AudioSegment.converter = ffmpeg_path
+            AudioSegment.ffmpeg = ffmpeg_path  
+            AudioSegment.ffprobe = ffprobe_path
+
+            # MONKEY PATCH the AudioSegment class to ALWAYS use our paths
+            original_init = AudioSegment.__init__
+            def patched_init(self, *args, **kwargs):
+                result = original_init(self, *args, **kwargs)
+                # Ensure our FFmpeg paths are ALWAYS set
+                AudioSegment.converter = ffmpeg_path
+                AudioSegment.ffmpeg = ffmpeg_path
+                AudioSegment.ffprobe = ffprobe_path
+                return result
+            AudioSegment.__init__ = patched_init
+
+            print(f"REAL TEST FFmpeg GLOBALLY configured and MONKEY-PATCHED: {ffmpeg_path}, ffprobe: {ffprobe_path}")
+
+            # FORCE PATH ENVIRONMENT WITH FFmpeg FOR REAL TEST
+            ffmpeg_dirs = [
+                "/opt/homebrew/bin",  # Homebrew ARM Mac
+                "/usr/local/bin",     # Homebrew Intel Mac  
+                "/usr/bin",           # Linux system
+                "/bin"                # Linux fallback
+            ]
+            current_path = os.environ.get('PATH', '')
+            for ffmpeg_dir in ffmpeg_dirs:
+                if ffmpeg_dir not in current_path:
+                    current_path = f"{ffmpeg_dir}:{current_path}"
+            os.environ['PATH'] = current_path
+            print(f"REAL TEST PATH FORCED: {os.environ['PATH'][:200]}...")
+        else:
+            print(f"REAL TEST FFmpeg auto-detection FAILED: ffmpeg={ffmpeg_path}, ffprobe={ffprobe_path}")
+            raise RuntimeError("FFmpeg/ffprobe not found for real tests!")
+
+    if "app.services.transcription_service" in sys.modules and "app.services.transcription_service" in stale_modules:
+        print("Reloading transcription_service to pick up reloaded audio_service")
+        importlib.reload(sys.modules["app.services.transcription_service"])
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _real_modules():
+    """Load the real heavy dependencies only once a real test is actually selected."""
+    # Collection (and runs that deselect every real test) never import torch or whisper
+    _install_real_modules()
+
+
+@pytest.fixture(scope="session")
+def _real_engine():
+    """Create the session-wide in-memory database and schema for real tests."""
+    # StaticPool hands the same single connection to every thread, so background
+    # transcription threads see this in-memory database without a file on disk.
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    # Fresh in-memory database: nothing exists yet, so skip the per-table existence checks
+    Base.metadata.create_all(bind=engine, checkfirst=False)
+
+    # Store engine and sessionmaker in app state so background threads can access it
+    fastapi_app.state.test_engine = engine
+    fastapi_app.state.test_sessionmaker = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _shared_whisper_models(_real_modules):
+    """Load each real Whisper model once per session, however many services request it."""
+    from app.services.transcription_service import TranscriptionService
+
+    original_load = TranscriptionService._load_whisper_model
+    loaded = {}
+
+    def load_once(self, whisper_module, target_size, device, progress_callback=None):
+        key = (target_size, device)
+        if key not in loaded:
+            loaded[key] = original_load(
+                self, whisper_module, target_size, device, progress_callback=progress_callback
+            )
+        return loaded[key]
+
+    # Loading stays lazy so sessions whose real tests skip never pay for the LARGE model
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(TranscriptionService, "_load_whisper_model", load_once)
+        yield loaded
 
 
 @pytest.fixture(scope="function")
-def client(test_db):
-    """Create a test client with the test database."""
+def test_db(_real_engine):
+    """Create a test database session; rows are deleted after each test."""
+    engine = _real_engine
+    TestingSessionLocal = fastapi_app.state.test_sessionmaker
+
+    # CRITICAL: Override the global SessionLocal used by transcribe_task
+    # transcribe_task creates its own session via SessionLocal() instead of using dependency injection
+    import app.core.database as db_module
+    original_session_local = db_module.SessionLocal
+    db_module.SessionLocal = TestingSessionLocal
+
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        # Restore original SessionLocal
+        db_module.SessionLocal = original_session_local
+        # Empty the tables instead of dropping and recreating the schema
+        with engine.begin() as conn:
+            for table in reversed(Base.metadata.sorted_tables):
+                conn.execute(table.delete())
+
+
+@pytest.fixture(scope="session")
+def _get_db_override(_real_engine):
+    """Route get_db to the real-test database once for the whole session."""
     def override_get_db():
         # Create a NEW session for each request (thread-safe)
         db = fastapi_app.state.test_sessionmaker()
@@ -223,82 +280,82 @@ def client(test_db):
             db.close()
 
     fastapi_app.dependency_overrides[get_db] = override_get_db
+    yield
+    fastapi_app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.fixture(scope="session")
+def _real_client(_get_db_override):
+    """Enter the application lifespan once for all real tests."""
     with TestClient(fastapi_app) as client:
         yield client
-    fastapi_app.dependency_overrides.clear()
 
 
 @pytest.fixture(scope="function")
-def sample_project(test_db):
-    """Create a sample project for testing."""
-    project = Project(name="Test Project")
-    test_db.add(project)
-    test_db.commit()
-    test_db.refresh(project)
-    return project
+def client(test_db, _real_client):
+    """Create a test client with the test database."""
+    _real_client.cookies.clear()
+    yield _real_client
+
+
+# sample_project comes from the parent conftest and resolves against this test_db.
+
+
+# Locations searched for the shared 30-second audio fixture
+_FIXTURE_AUDIO_PATHS = (
+    os.path.join(os.path.dirname(__file__), "..", "..", "..", "tests", "fixtures", "test-audio-30s.mp3"),
+    os.path.join(os.path.dirname(__file__), "..", "..", "tests", "fixtures", "test-audio-30s.mp3"),
+    "/Users/markomanninen/Documents/GitHub/transcribe/tests/fixtures/test-audio-30s.mp3",
+)
+
+
+@pytest.fixture(scope="session")
+def _test_audio_path():
+    """Resolve the fixture audio once per session; skip real tests that need it if missing."""
+    for path in _FIXTURE_AUDIO_PATHS:
+        if os.path.exists(path):
+            print(f"Using test audio file: {path}")
+            return Path(path)
+
+    # Print available paths for debugging
+    print("Could not find test-audio-30s.mp3 in any of these locations:")
+    for path in _FIXTURE_AUDIO_PATHS:
+        print(f"  - {path} (exists: {os.path.exists(path)})")
+
+    # List what's actually in the fixtures directory
+    fixtures_dir = os.path.join(os.path.dirname(__file__), "..", "..", "tests", "fixtures")
+    if os.path.exists(fixtures_dir):
+        print(f"\nContents of {fixtures_dir}:")
+        print(f"  {os.listdir(fixtures_dir)}")
+    pytest.skip("fixture audio test-audio-30s.mp3 not available")
+
+
+@functools.lru_cache(maxsize=None)
+def _fixture_bytes(path):
+    """Read a fixture audio file once and keep its bytes for later tests."""
+    return path.read_bytes()
 
 
 @pytest.fixture(scope="function")
-def sample_audio_file(test_db, sample_project):
+def sample_audio_file(test_db, sample_project, _test_audio_path, tmp_path):
     """Create a sample audio file for testing."""
-    # Find the correct path to test audio fixture
-    # Look in multiple possible locations
-    possible_paths = [
-        os.path.join(os.path.dirname(__file__), "..", "..", "..", "tests", "fixtures", "test-audio-30s.mp3"),
-        os.path.join(os.path.dirname(__file__), "..", "..", "tests", "fixtures", "test-audio-30s.mp3"),
-        "/Users/markomanninen/Documents/GitHub/transcribe/tests/fixtures/test-audio-30s.mp3",
-    ]
-
-    test_audio_path = None
-    for path in possible_paths:
-        if os.path.exists(path):
-            test_audio_path = path
-            break
-
-    if not test_audio_path:
-        # Print available paths for debugging
-        print("Could not find test-audio-30s.mp3 in any of these locations:")
-        for path in possible_paths:
-            print(f"  - {path} (exists: {os.path.exists(path)})")
-
-        # List what's actually in the fixtures directory
-        fixtures_dir = os.path.join(os.path.dirname(__file__), "..", "..", "tests", "fixtures")
-        if os.path.exists(fixtures_dir):
-            print(f"\nContents of {fixtures_dir}:")
-            print(f"  {os.listdir(fixtures_dir)}")
-
-    # Create temp file
-    with tempfile.NamedTemporaryFile(mode='wb', suffix='.mp3', delete=False) as tmp:
-        if test_audio_path and os.path.exists(test_audio_path):
-            print(f"Using test audio file: {test_audio_path}")
-            with open(test_audio_path, 'rb') as src:
-                tmp.write(src.read())
-        else:
-            print(" Creating minimal MP3 file (no real audio fixture found)")
-            # Create minimal MP3 if fixture doesn't exist
-            tmp.write(b'\xff\xfb' + b'\x00' * 1000)
-        tmp_path = tmp.name
+    # pytest owns tmp_path cleanup, so nothing leaks when the test fails
+    audio_path = tmp_path / "test-audio.mp3"
+    audio_path.write_bytes(_fixture_bytes(_test_audio_path))
 
     audio_file = AudioFile(
         project_id=sample_project.id,
         filename="test-audio.mp3",  # Required field
         original_filename="test-audio-30s.mp3",
-        file_path=tmp_path,
-        file_size=os.path.getsize(tmp_path),
+        file_path=str(audio_path),
+        file_size=audio_path.stat().st_size,
         duration=30.0,
         format="mp3",  # Required field
         transcription_status=TranscriptionStatus.PENDING
     )
     test_db.add(audio_file)
+    # Committed rows are visible to the background thread's own session
     test_db.commit()
     test_db.refresh(audio_file)
 
-    # CRITICAL: Flush the session to ensure the audio file is written to the database
-    # This makes it visible to other sessions (like the background thread)
-    test_db.flush()
-
-    yield audio_file
-
-    # Cleanup
-    if os.path.exists(tmp_path):
-        os.unlink(tmp_path)
+    return audio_file
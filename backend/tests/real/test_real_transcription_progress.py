@@ -7,6 +7,8 @@ CURRENTLY SKIPPED due to FFmpeg configuration challenges in real test environmen
 import time
 import pytest
 
+# Excluded from the parallel run by -m "not real"; real tests only run serially
+pytestmark = pytest.mark.real
 
 
 @pytest.mark.slow
@@ -45,7 +47,9 @@ def test_real_transcription_with_large_model_progress(client, sample_project, sa
     progress_history = []
     stage_history = []
     last_progress = -1.0
-    stuck_count = 0
+    stuck_seconds = 0.0
+    last_change_time = time.time()
+    poll_interval = 0.25  # Fast while progress moves, backs off up to 2s when stuck
 
     # Different timeouts for different phases:
     # - Model loading can take 60+ seconds (3GB model loading into memory)
@@ -96,12 +100,16 @@ def test_real_transcription_with_large_model_progress(client, sample_project, sa
                 )
 
             last_progress = current_progress
-            stuck_count = 0
+            last_change_time = time.time()
+            stuck_seconds = 0.0
+            poll_interval = 0.25
         else:
-            stuck_count += 1
+            previous_stuck = stuck_seconds
+            stuck_seconds = time.time() - last_change_time
+            poll_interval = min(2.0, poll_interval * 1.5)
             # Print stuck status every 10 seconds
-            if stuck_count % 10 == 0:
-                print(f"[{elapsed:>6.1f}s] STUCK at {current_progress*100:>5.1f}% for {stuck_count}s | {current_status} | {current_stage} | Model loaded: {model_loaded}")
+            if int(stuck_seconds // 10) > int(previous_stuck // 10):
+                print(f"[{elapsed:>6.1f}s] STUCK at {current_progress*100:>5.1f}% for {stuck_seconds:.0f}s | {current_status} | {current_stage} | Model loaded: {model_loaded}")
 
         # Record unique stages
         if current_stage not in stage_history:
@@ -122,20 +130,20 @@ def test_real_transcription_with_large_model_progress(client, sample_project, sa
         # Check if stuck - use different timeout based on phase
         max_stuck_allowed = max_stuck_during_transcription if model_loaded else max_stuck_during_init
 
-        if stuck_count >= max_stuck_allowed:
+        if stuck_seconds >= max_stuck_allowed:
             phase = "transcription" if model_loaded else "initialization (model loading)"
             pytest.fail(
-                f"PROGRESS STUCK at {last_progress*100:.1f}% for {stuck_count} seconds during {phase}!\n"
+                f"PROGRESS STUCK at {last_progress*100:.1f}% for {stuck_seconds:.0f} seconds during {phase}!\n"
                 f"Last stage: {current_stage}\n"
                 f"Status: {current_status}"
             )
 
-        time.sleep(1)
+        time.sleep(poll_interval)
     else:
         pytest.fail(f"Transcription timed out after {timeout} seconds")
 
-    # Final verification
-    final_status = client.get(f"/api/transcription/{file_id}/status").json()
+    # Final verification - the loop only exits here after a completed status response
+    final_status = status_data
 
     print("\n" + "-" * 80)
     print("FINAL VERIFICATION")
@@ -1,38 +1,97 @@
 """
 Tests for AI correction endpoints.
 """
+import httpx
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
+from fastapi.testclient import TestClient
 
+from app.core.database import get_db
 
 
-@pytest.fixture
-def mock_llm_service():
-    """Mock LLM service for testing."""
-    with patch('app.api.ai_corrections.LLMService') as mock:
-        service_instance = MagicMock()
-        mock.return_value = service_instance
+_DEFAULT_CORRECTION = {
+    "original_text": "This is a test sentance with an error.",
+    "corrected_text": "This is a test sentence with an error.",
+    "changes": ['"sentance" → "sentence"'],
+    "confidence": 0.95
+}
+
+
+class _LLMStub:
+    """Stand-in for LLMService exposing only what the correction endpoints call."""
 
+    def __init__(self):
         # Mock correct_text response
-        service_instance.correct_text = AsyncMock(return_value={
-            "original_text": "This is a test sentance with an error.",
-            "corrected_text": "This is a test sentence with an error.",
-            "changes": ['"sentance" → "sentence"'],
-            "confidence": 0.95
-        })
+        self._default_correct_text = AsyncMock(return_value=_DEFAULT_CORRECTION)
 
         # Mock health_check_all response
-        service_instance.health_check_all = AsyncMock(return_value={
+        self._default_health_check_all = AsyncMock(return_value={
             "ollama": True,
             "openrouter": False
         })
 
         # Mock list_providers response
-        service_instance.list_providers.return_value = ["ollama", "openrouter"]
+        self._default_list_providers = MagicMock(return_value=["ollama", "openrouter"])
+        self.reset()
+
+    def reset(self):
+        """Restore the default responses and drop recorded calls."""
+        # Tests may replace a mock outright (e.g. a side_effect list); put the defaults back
+        self.correct_text = self._default_correct_text
+        self.health_check_all = self._default_health_check_all
+        self.list_providers = self._default_list_providers
+        for mock in (self.correct_text, self.health_check_all, self.list_providers):
+            mock.reset_mock(side_effect=True)
+
 
+@pytest.fixture(scope="module")
+def mock_llm_service():
+    """Mock LLM service for testing, patched once for the whole module."""
+    service_instance = _LLMStub()
+    with patch('app.api.ai_corrections.LLMService', return_value=service_instance):
         yield service_instance
 
 
+@pytest.fixture(autouse=True)
+def reset_mock_llm_service(mock_llm_service):
+    """Restore the default mock responses and clear recorded calls before each test."""
+    mock_llm_service.reset()
+
+
+@pytest.fixture
+def first_three_segment_ids(sample_segments):
+    """IDs of the first three sample segments, the batch size the batch tests use."""
+    return [seg.id for seg in sample_segments[:3]]
+
+
+@pytest.fixture(scope="module")
+def _corrections_client(ai_corrections_app):
+    """One TestClient over the corrections-only app for the whole module."""
+    with TestClient(ai_corrections_app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def client(_corrections_client, ai_corrections_app, test_db):
+    """Test client for the corrections router, bound to the test database."""
+
+    def override_get_db():
+        yield test_db
+
+    ai_corrections_app.dependency_overrides[get_db] = override_get_db
+    yield _corrections_client
+    ai_corrections_app.dependency_overrides.clear()
+
+
+@pytest.fixture
+async def async_client(client, ai_corrections_app):
+    """Call the app in the test's event loop instead of through TestClient's thread portal."""
+    # Requesting client installs the get_db override
+    transport = httpx.ASGITransport(app=ai_corrections_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as async_client:
+        yield async_client
+
+
 def test_correct_segment_success(client, test_db, sample_project, sample_audio_file, sample_segments, mock_llm_service):
     """Test successful segment correction."""
     segment = sample_segments[0]
@@ -131,11 +190,12 @@ def test_correct_segment_passive_rejected(client, test_db, sample_project, sampl
     mock_llm_service.correct_text.assert_not_called()
 
 
-def test_correct_batch_success(client, test_db, sample_project, sample_audio_file, sample_segments, mock_llm_service):
+@pytest.mark.asyncio
+async def test_correct_batch_success(async_client, test_db, sample_project, sample_audio_file, first_three_segment_ids, mock_llm_service):
     """Test batch correction of multiple segments."""
-    segment_ids = [seg.id for seg in sample_segments[:3]]  # Use 3 segments
+    segment_ids = first_three_segment_ids
 
-    response = client.post(
+    response = await async_client.post(
         "/api/ai/correct-batch",
         json={
             "segment_ids": segment_ids,
@@ -155,13 +215,14 @@ def test_correct_batch_success(client, test_db, sample_project, sample_audio_fil
         assert "changes" in result
 
 
-def test_correct_batch_rejects_passive_segments(client, test_db, sample_project, sample_audio_file, sample_segments, mock_llm_service):
+@pytest.mark.asyncio
+async def test_correct_batch_rejects_passive_segments(async_client, test_db, sample_project, sample_audio_file, sample_segments, mock_llm_service):
     """Batch correction should fail if any segment is passive."""
     segment_ids = [seg.id for seg in sample_segments[:2]]
     sample_segments[0].is_passive = True
     test_db.commit()
 
-    response = client.post(
+    response = await async_client.post(
         "/api/ai/correct-batch",
         json={"segment_ids": segment_ids, "provider": "ollama"}
     )
@@ -171,12 +232,13 @@ def test_correct_batch_rejects_passive_segments(client, test_db, sample_project,
     mock_llm_service.correct_text.assert_not_called()
 
 
-def test_correct_batch_partial_not_found(client, test_db, sample_project, sample_audio_file, sample_segments, mock_llm_service):
+@pytest.mark.asyncio
+async def test_correct_batch_partial_not_found(async_client, test_db, sample_project, sample_audio_file, sample_segments, mock_llm_service):
     """Test batch correction with some invalid segment IDs."""
     valid_id = sample_segments[0].id
     invalid_id = 99999
 
-    response = client.post(
+    response = await async_client.post(
         "/api/ai/correct-batch",
         json={
             "segment_ids": [valid_id, invalid_id],
@@ -188,7 +250,8 @@ def test_correct_batch_partial_not_found(client, test_db, sample_project, sample
     assert "not found" in response.json()["detail"].lower()
 
 
-def test_correct_batch_handles_individual_failures(client, test_db, sample_project, sample_audio_file, sample_segments, mock_llm_service):
+@pytest.mark.asyncio
+async def test_correct_batch_handles_individual_failures(async_client, test_db, sample_project, sample_audio_file, first_three_segment_ids, mock_llm_service):
     """Test batch correction handles individual segment failures gracefully."""
     # Mock service to fail on second call
     mock_llm_service.correct_text = AsyncMock(side_effect=[
@@ -207,9 +270,9 @@ def test_correct_batch_handles_individual_failures(client, test_db, sample_proje
         }
     ])
 
-    segment_ids = [seg.id for seg in sample_segments[:3]]  # Use 3 segments
+    segment_ids = first_three_segment_ids
 
-    response = client.post(
+    response = await async_client.post(
         "/api/ai/correct-batch",
         json={
             "segment_ids": segment_ids,
@@ -228,7 +291,7 @@ def test_correct_batch_handles_individual_failures(client, test_db, sample_proje
 
     # Check second failed (has error in changes)
     assert data[1]["confidence"] == 0.0
-    assert any("Error" in change for change in data[1]["changes"])
+    assert data[1]["changes"] == ["Error: LLM service error"]
 
     # Check third succeeded
     assert data[2]["confidence"] > 0
@@ -262,67 +325,51 @@ def test_health_check_providers(client, test_db, mock_llm_service):
     assert isinstance(data["ollama"], bool)
 
 
-def test_correction_type_validation(client, test_db, sample_project, sample_audio_file, sample_segments, mock_llm_service):
+@pytest.mark.parametrize("correction_type", ["grammar", "spelling", "punctuation", "all"])
+def test_correction_type_validation(client, test_db, sample_project, sample_audio_file, sample_segments, mock_llm_service, correction_type):
     """Test different correction types are passed correctly."""
     segment = sample_segments[0]
 
-    for correction_type in ["grammar", "spelling", "punctuation", "all"]:
-        response = client.post(
-            "/api/ai/correct-segment",
-            json={
-                "segment_id": segment.id,
-                "provider": "ollama",
-                "correction_type": correction_type
-            }
-        )
-
-        assert response.status_code == 200
-
-        # Verify correction_type was passed to LLM service
-        call_args = mock_llm_service.correct_text.call_args
-        assert call_args[1]["correction_type"] == correction_type
-
-
-def test_provider_unavailable_error(client, test_db, sample_project, sample_audio_file, sample_segments):
-    """Test error when provider is unavailable."""
-    with patch('app.api.ai_corrections.LLMService') as mock:
-        service_instance = MagicMock()
-        mock.return_value = service_instance
-        service_instance.correct_text = AsyncMock(side_effect=ConnectionError("Provider not responding"))
-
-        segment = sample_segments[0]
+    response = client.post(
+        "/api/ai/correct-segment",
+        json={
+            "segment_id": segment.id,
+            "provider": "ollama",
+            "correction_type": correction_type
+        }
+    )
 
-        response = client.post(
-            "/api/ai/correct-segment",
-            json={
-                "segment_id": segment.id,
-                "provider": "ollama"
-            }
-        )
+    assert response.status_code == 200
 
-        assert response.status_code == 503
-        assert "not responding" in response.json()["detail"].lower()
+    # Verify correction_type was passed to LLM service
+    call_args = mock_llm_service.correct_text.call_args
+    assert call_args[1]["correction_type"] == correction_type
 
 
-def test_invalid_provider_error(client, test_db, sample_project, sample_audio_file, sample_segments):
-    """Test error when provider doesn't exist."""
-    with patch('app.api.ai_corrections.LLMService') as mock:
-        service_instance = MagicMock()
-        mock.return_value = service_instance
-        service_instance.correct_text = AsyncMock(side_effect=ValueError("Provider 'invalid' not available"))
+@pytest.mark.parametrize(
+    "provider, error, expected_status, needle",
+    [
+        pytest.param("ollama", ConnectionError("Provider not responding"), 503, "not responding", id="unavailable"),
+        pytest.param("invalid_provider", ValueError("Provider 'invalid' not available"), 400, "not available", id="invalid"),
+    ],
+)
+def test_provider_error(client, test_db, sample_project, sample_audio_file, sample_segments, mock_llm_service,
+                        provider, error, expected_status, needle):
+    """Test provider failures map to the right HTTP error."""
+    mock_llm_service.correct_text.side_effect = error
 
-        segment = sample_segments[0]
+    segment = sample_segments[0]
 
-        response = client.post(
-            "/api/ai/correct-segment",
-            json={
-                "segment_id": segment.id,
-                "provider": "invalid_provider"
-            }
-        )
+    response = client.post(
+        "/api/ai/correct-segment",
+        json={
+            "segment_id": segment.id,
+            "provider": provider
+        }
+    )
 
-        assert response.status_code == 400
-        assert "not available" in response.json()["detail"].lower()
+    assert response.status_code == expected_status
+    assert needle in response.json()["detail"].lower()
 
 
 def test_correct_segment_with_surrounding_context(client, test_db, sample_project, sample_audio_file, sample_segments, mock_llm_service):
@@ -396,15 +443,16 @@ def test_correct_segment_with_content_type_context(client, test_db, sample_proje
     assert "Content type: lyrics" in context
 
 
-def test_correct_batch_with_surrounding_context(client, test_db, sample_project, sample_audio_file, sample_segments, mock_llm_service):
+@pytest.mark.asyncio
+async def test_correct_batch_with_surrounding_context(async_client, test_db, sample_project, sample_audio_file, first_three_segment_ids, mock_llm_service):
     """Test batch correction includes context for each segment."""
     # Set content type
     sample_project.content_type = "interview"
     test_db.commit()
 
-    segment_ids = [seg.id for seg in sample_segments[:3]]
+    segment_ids = first_three_segment_ids
 
-    response = client.post(
+    response = await async_client.post(
         "/api/ai/correct-batch",
         json={
             "segment_ids": segment_ids,
@@ -436,13 +484,12 @@ def test_parse_correction_removes_context():
     """Test that parsing removes included context from LLM response."""
     from app.services.llm.ollama_provider import OllamaProvider
 
-    provider = OllamaProvider()
     original = "But let go before it felt too right"  # 8 words
 
     # LLM incorrectly included previous context (13 words total)
     llm_response = "One bridge, one's held tight But let go before it felt too right."
 
-    result = provider._parse_correction(llm_response, original)
+    result = OllamaProvider._parse_correction(llm_response, original)
 
     # Should extract only the portion close to 8 words (allow 50% tolerance)
     result_words = len(result.split())
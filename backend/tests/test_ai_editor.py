@@ -1,39 +1,97 @@
+import asyncio
+
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
-from fastapi.testclient import TestClient
-from app.main import app
-from app.services.ai_editor_service import AIEditorService
+from unittest.mock import patch, MagicMock
+
+SAMPLE_PROJECT_ID = 1
+SAMPLE_TEXT = "This is a sample text for testing AI editor functionality."
 
+# (endpoint, request body, service method it calls)
+ENDPOINTS_AND_DATA = [
+    ("/api/ai_editor/semantic-reconstruction", {"text": SAMPLE_TEXT, "project_id": SAMPLE_PROJECT_ID}, "semantic_reconstruction"),
+    ("/api/ai_editor/style-generation", {"text": SAMPLE_TEXT, "project_id": SAMPLE_PROJECT_ID, "target_style": "academic"}, "style_generation"),
+    ("/api/ai_editor/nlp-analysis", {"text": SAMPLE_TEXT, "project_id": SAMPLE_PROJECT_ID}, "nlp_analysis"),
+    ("/api/ai_editor/fact-checking", {"text": SAMPLE_TEXT, "project_id": SAMPLE_PROJECT_ID}, "fact_checking"),
+    ("/api/ai_editor/technical-check", {"text_with_metadata": "[00:00] " + SAMPLE_TEXT, "project_id": SAMPLE_PROJECT_ID, "target_format": "SRT"}, "technical_check"),
+]
 
-client = TestClient(app)
+
+@pytest.fixture(scope="session")
+def app_instance(ai_editor_app):
+    """Serve aclient from the AI editor router alone, without middleware or lifespan."""
+    return ai_editor_app
 
 
 @pytest.fixture
 def sample_project_id():
-    return 1
+    return SAMPLE_PROJECT_ID
 
 
 @pytest.fixture
 def sample_text():
-    return "This is a sample text for testing AI editor functionality."
+    return SAMPLE_TEXT
+
+
+class _FakeEditor:
+    """Handwritten stand-in for AIEditorService that records each call."""
+
+    def __init__(self):
+        self.calls: list[tuple[str, dict]] = []
+        self._results: dict[str, object] = {}
+
+    def set(self, method: str, value):
+        """Make method return value, or raise it when it is an exception."""
+        self._results[method] = value
+
+    def _respond(self, method: str, kwargs: dict):
+        self.calls.append((method, kwargs))
+        result = self._results.get(method)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def semantic_reconstruction(self, **kwargs):
+        return self._respond("semantic_reconstruction", kwargs)
+
+    async def style_generation(self, **kwargs):
+        return self._respond("style_generation", kwargs)
+
+    async def nlp_analysis(self, **kwargs):
+        return self._respond("nlp_analysis", kwargs)
+
+    async def fact_checking(self, **kwargs):
+        return self._respond("fact_checking", kwargs)
+
+    async def technical_check(self, **kwargs):
+        return self._respond("technical_check", kwargs)
 
 
 @pytest.fixture
-def mock_ai_editor_service():
-    with patch('app.api.ai_editor.AIEditorService') as mock:
-        service_instance = AsyncMock(spec=AIEditorService)
-        mock.return_value = service_instance
-        yield service_instance
+def fake_ai_editor_service():
+    fake = _FakeEditor()
+    with patch('app.api.ai_editor.AIEditorService', return_value=fake):
+        yield fake
+
+
+@pytest.fixture(scope="module")
+def mock_db_session():
+    # No spec=Session: the service only stores the session, and spec walks SQLAlchemy's Session class
+    return MagicMock()
+
+
+@pytest.fixture(scope="module")
+def mock_llm():
+    return MagicMock()
 
 
 class TestSemanticReconstructionEndpoint:
     """Test the semantic reconstruction API endpoint."""
 
-    def test_semantic_reconstruction_success(self, mock_ai_editor_service, sample_project_id, sample_text):
+    async def test_semantic_reconstruction_success(self, aclient, fake_ai_editor_service, sample_project_id, sample_text):
         """Test successful semantic reconstruction."""
         # Arrange
         expected_result = {"result": "This is a reconstructed version of the sample text with improved clarity and structure."}
-        mock_ai_editor_service.semantic_reconstruction.return_value = expected_result
+        fake_ai_editor_service.set("semantic_reconstruction", expected_result)
 
         request_data = {
             "text": sample_text,
@@ -42,61 +100,61 @@ class TestSemanticReconstructionEndpoint:
         }
 
         # Act
-        response = client.post("/api/ai_editor/semantic-reconstruction", json=request_data)
+        response = await aclient.post("/api/ai_editor/semantic-reconstruction", json=request_data)
 
         # Assert
         assert response.status_code == 200
         assert response.json() == expected_result
-        mock_ai_editor_service.semantic_reconstruction.assert_called_once_with(
-            text=sample_text, provider="ollama", project_id=sample_project_id
-        )
+        assert fake_ai_editor_service.calls == [
+            ("semantic_reconstruction", dict(text=sample_text, provider="ollama", project_id=sample_project_id))
+        ]
 
-    def test_semantic_reconstruction_with_default_provider(self, mock_ai_editor_service, sample_project_id, sample_text):
+    async def test_semantic_reconstruction_with_default_provider(self, aclient, fake_ai_editor_service, sample_project_id, sample_text):
         """Test semantic reconstruction with default provider."""
         expected_result = {"result": "Reconstructed text"}
-        mock_ai_editor_service.semantic_reconstruction.return_value = expected_result
+        fake_ai_editor_service.set("semantic_reconstruction", expected_result)
 
         request_data = {
             "text": sample_text,
             "project_id": sample_project_id
         }
 
-        response = client.post("/api/ai_editor/semantic-reconstruction", json=request_data)
+        response = await aclient.post("/api/ai_editor/semantic-reconstruction", json=request_data)
 
         assert response.status_code == 200
-        mock_ai_editor_service.semantic_reconstruction.assert_called_once_with(
-            text=sample_text, provider="ollama", project_id=sample_project_id
-        )
+        assert fake_ai_editor_service.calls == [
+            ("semantic_reconstruction", dict(text=sample_text, provider="ollama", project_id=sample_project_id))
+        ]
 
-    def test_semantic_reconstruction_missing_text(self, sample_project_id):
+    async def test_semantic_reconstruction_missing_text(self, aclient, sample_project_id):
         """Test semantic reconstruction with missing text field."""
         request_data = {
             "project_id": sample_project_id
         }
 
-        response = client.post("/api/ai_editor/semantic-reconstruction", json=request_data)
+        response = await aclient.post("/api/ai_editor/semantic-reconstruction", json=request_data)
         assert response.status_code == 422
 
-    def test_semantic_reconstruction_service_error(self, mock_ai_editor_service, sample_project_id, sample_text):
+    async def test_semantic_reconstruction_service_error(self, aclient, fake_ai_editor_service, sample_project_id, sample_text):
         """Test semantic reconstruction when service raises an exception."""
-        mock_ai_editor_service.semantic_reconstruction.side_effect = Exception("AI service unavailable")
+        fake_ai_editor_service.set("semantic_reconstruction", Exception("AI service unavailable"))
 
         request_data = {
             "text": sample_text,
             "project_id": sample_project_id
         }
 
-        response = client.post("/api/ai_editor/semantic-reconstruction", json=request_data)
+        response = await aclient.post("/api/ai_editor/semantic-reconstruction", json=request_data)
         assert response.status_code == 500
 
 
 class TestStyleGenerationEndpoint:
     """Test the style generation API endpoint."""
 
-    def test_style_generation_success(self, mock_ai_editor_service, sample_project_id, sample_text):
+    async def test_style_generation_success(self, aclient, fake_ai_editor_service, sample_project_id, sample_text):
         """Test successful style generation."""
         expected_result = {"result": "This sample text has been transformed into an academic writing style."}
-        mock_ai_editor_service.style_generation.return_value = expected_result
+        fake_ai_editor_service.set("style_generation", expected_result)
 
         request_data = {
             "text": sample_text,
@@ -105,53 +163,51 @@ class TestStyleGenerationEndpoint:
             "provider": "ollama"
         }
 
-        response = client.post("/api/ai_editor/style-generation", json=request_data)
+        response = await aclient.post("/api/ai_editor/style-generation", json=request_data)
 
         assert response.status_code == 200
         assert response.json() == expected_result
-        mock_ai_editor_service.style_generation.assert_called_once_with(
-            text=sample_text, target_style="academic", provider="ollama", project_id=sample_project_id
-        )
+        assert fake_ai_editor_service.calls == [
+            ("style_generation", dict(text=sample_text, target_style="academic", provider="ollama", project_id=sample_project_id))
+        ]
 
-    def test_style_generation_all_styles(self, mock_ai_editor_service, sample_project_id, sample_text):
-        """Test style generation with all available styles."""
-        styles = ["academic", "conversational", "formal", "journalistic", "technical"]
-        
-        for style in styles:
-            mock_ai_editor_service.style_generation.return_value = {"result": f"Text in {style} style"}
-            
-            request_data = {
-                "text": sample_text,
-                "project_id": sample_project_id,
-                "target_style": style
-            }
-
-            response = client.post("/api/ai_editor/style-generation", json=request_data)
-            assert response.status_code == 200
-            assert response.json()["result"] == f"Text in {style} style"
-
-    def test_style_generation_missing_target_style(self, sample_project_id, sample_text):
+    @pytest.mark.parametrize("style", ["academic", "conversational", "formal", "journalistic", "technical"])
+    async def test_style_generation_all_styles(self, aclient, fake_ai_editor_service, sample_project_id, sample_text, style):
+        """Test style generation with each available style."""
+        fake_ai_editor_service.set("style_generation", {"result": f"Text in {style} style"})
+
+        request_data = {
+            "text": sample_text,
+            "project_id": sample_project_id,
+            "target_style": style
+        }
+
+        response = await aclient.post("/api/ai_editor/style-generation", json=request_data)
+        assert response.status_code == 200
+        assert response.json()["result"] == f"Text in {style} style"
+
+    async def test_style_generation_missing_target_style(self, aclient, sample_project_id, sample_text):
         """Test style generation with missing target_style field."""
         request_data = {
             "text": sample_text,
             "project_id": sample_project_id
         }
 
-        response = client.post("/api/ai_editor/style-generation", json=request_data)
+        response = await aclient.post("/api/ai_editor/style-generation", json=request_data)
         assert response.status_code == 422
 
 
 class TestNLPAnalysisEndpoint:
     """Test the NLP analysis API endpoint."""
 
-    def test_nlp_analysis_success(self, mock_ai_editor_service, sample_project_id, sample_text):
+    async def test_nlp_analysis_success(self, aclient, fake_ai_editor_service, sample_project_id, sample_text):
         """Test successful NLP analysis."""
         expected_result = {
             "summary": "This text discusses testing AI functionality",
             "themes": ["testing", "AI", "functionality"],
             "structure": "Simple declarative sentence"
         }
-        mock_ai_editor_service.nlp_analysis.return_value = expected_result
+        fake_ai_editor_service.set("nlp_analysis", expected_result)
 
         request_data = {
             "text": sample_text,
@@ -159,15 +215,15 @@ class TestNLPAnalysisEndpoint:
             "provider": "ollama"
         }
 
-        response = client.post("/api/ai_editor/nlp-analysis", json=request_data)
+        response = await aclient.post("/api/ai_editor/nlp-analysis", json=request_data)
 
         assert response.status_code == 200
         assert response.json() == expected_result
-        mock_ai_editor_service.nlp_analysis.assert_called_once_with(
-            text=sample_text, provider="ollama", project_id=sample_project_id
-        )
+        assert fake_ai_editor_service.calls == [
+            ("nlp_analysis", dict(text=sample_text, provider="ollama", project_id=sample_project_id))
+        ]
 
-    def test_nlp_analysis_complex_result(self, mock_ai_editor_service, sample_project_id):
+    async def test_nlp_analysis_complex_result(self, aclient, fake_ai_editor_service, sample_project_id):
         """Test NLP analysis with complex structured result."""
         complex_text = "This is a multi-sentence paragraph. It contains various themes and topics. The structure is conversational and informative."
         expected_result = {
@@ -177,14 +233,14 @@ class TestNLPAnalysisEndpoint:
             "sentiment": "neutral",
             "key_entities": ["text", "themes", "topics"]
         }
-        mock_ai_editor_service.nlp_analysis.return_value = expected_result
+        fake_ai_editor_service.set("nlp_analysis", expected_result)
 
         request_data = {
             "text": complex_text,
             "project_id": sample_project_id
         }
 
-        response = client.post("/api/ai_editor/nlp-analysis", json=request_data)
+        response = await aclient.post("/api/ai_editor/nlp-analysis", json=request_data)
 
         assert response.status_code == 200
         assert response.json() == expected_result
@@ -193,7 +249,7 @@ class TestNLPAnalysisEndpoint:
 class TestFactCheckingEndpoint:
     """Test the fact checking API endpoint."""
 
-    def test_fact_checking_success(self, mock_ai_editor_service, sample_project_id):
+    async def test_fact_checking_success(self, aclient, fake_ai_editor_service, sample_project_id):
         """Test successful fact checking."""
         text_with_facts = "The Earth revolves around the Sun. Python was created in 1991."
         expected_result = {
@@ -210,7 +266,7 @@ class TestFactCheckingEndpoint:
                 }
             ]
         }
-        mock_ai_editor_service.fact_checking.return_value = expected_result
+        fake_ai_editor_service.set("fact_checking", expected_result)
 
         request_data = {
             "text": text_with_facts,
@@ -219,33 +275,31 @@ class TestFactCheckingEndpoint:
             "provider": "ollama"
         }
 
-        response = client.post("/api/ai_editor/fact-checking", json=request_data)
+        response = await aclient.post("/api/ai_editor/fact-checking", json=request_data)
 
         assert response.status_code == 200
         assert response.json() == expected_result
-        mock_ai_editor_service.fact_checking.assert_called_once_with(
-            text=text_with_facts, domain="general", provider="ollama", project_id=sample_project_id
-        )
+        assert fake_ai_editor_service.calls == [
+            ("fact_checking", dict(text=text_with_facts, domain="general", provider="ollama", project_id=sample_project_id))
+        ]
 
-    def test_fact_checking_domain_specific(self, mock_ai_editor_service, sample_project_id):
-        """Test fact checking with specific domains."""
-        domains = ["history", "science", "technology", "medicine", "general"]
-        
-        for domain in domains:
-            mock_ai_editor_service.fact_checking.return_value = {
-                "verifications": [{"domain_specific": True, "domain": domain}]
-            }
-            
-            request_data = {
-                "text": "Domain specific fact",
-                "project_id": sample_project_id,
-                "domain": domain
-            }
-
-            response = client.post("/api/ai_editor/fact-checking", json=request_data)
-            assert response.status_code == 200
-
-    def test_fact_checking_inaccurate_facts(self, mock_ai_editor_service, sample_project_id):
+    @pytest.mark.parametrize("domain", ["history", "science", "technology", "medicine", "general"])
+    async def test_fact_checking_domain_specific(self, aclient, fake_ai_editor_service, sample_project_id, domain):
+        """Test fact checking with a specific domain."""
+        fake_ai_editor_service.set("fact_checking", {
+            "verifications": [{"domain_specific": True, "domain": domain}]
+        })
+
+        request_data = {
+            "text": "Domain specific fact",
+            "project_id": sample_project_id,
+            "domain": domain
+        }
+
+        response = await aclient.post("/api/ai_editor/fact-checking", json=request_data)
+        assert response.status_code == 200
+
+    async def test_fact_checking_inaccurate_facts(self, aclient, fake_ai_editor_service, sample_project_id):
         """Test fact checking with inaccurate statements."""
         text_with_false_facts = "The Earth is flat. Python was created in 1985."
         expected_result = {
@@ -262,14 +316,14 @@ class TestFactCheckingEndpoint:
                 }
             ]
         }
-        mock_ai_editor_service.fact_checking.return_value = expected_result
+        fake_ai_editor_service.set("fact_checking", expected_result)
 
         request_data = {
             "text": text_with_false_facts,
             "project_id": sample_project_id
         }
 
-        response = client.post("/api/ai_editor/fact-checking", json=request_data)
+        response = await aclient.post("/api/ai_editor/fact-checking", json=request_data)
 
         assert response.status_code == 200
         assert response.json() == expected_result
@@ -278,12 +332,12 @@ class TestFactCheckingEndpoint:
 class TestTechnicalCheckEndpoint:
     """Test the technical format conversion API endpoint."""
 
-    def test_technical_check_srt_format(self, mock_ai_editor_service, sample_project_id):
+    async def test_technical_check_srt_format(self, aclient, fake_ai_editor_service, sample_project_id):
         """Test technical check for SRT format conversion."""
         text_with_metadata = "[00:00] Speaker A: Hello world. [00:05] Speaker B: How are you?"
         expected_srt = {"result": "1\n00:00:00,000 --> 00:00:05,000\nSpeaker A: Hello world.\n\n2\n00:00:05,000 --> 00:00:10,000\nSpeaker B: How are you?\n"}
         
-        mock_ai_editor_service.technical_check.return_value = expected_srt
+        fake_ai_editor_service.set("technical_check", expected_srt)
 
         request_data = {
             "text_with_metadata": text_with_metadata,
@@ -292,40 +346,37 @@ class TestTechnicalCheckEndpoint:
             "provider": "ollama"
         }
 
-        response = client.post("/api/ai_editor/technical-check", json=request_data)
+        response = await aclient.post("/api/ai_editor/technical-check", json=request_data)
 
         assert response.status_code == 200
         assert response.json() == expected_srt
-        mock_ai_editor_service.technical_check.assert_called_once_with(
-            text_with_metadata=text_with_metadata, target_format="SRT", provider="ollama", project_id=sample_project_id
-        )
-
-    def test_technical_check_all_formats(self, mock_ai_editor_service, sample_project_id):
-        """Test technical check with all supported formats."""
-        formats = ["SRT", "VTT", "transcript", "chapters"]
-        text_with_metadata = "[00:00] Speaker: Test content"
-        
-        for fmt in formats:
-            mock_ai_editor_service.technical_check.return_value = {"result": f"Content in {fmt} format"}
-            
-            request_data = {
-                "text_with_metadata": text_with_metadata,
-                "project_id": sample_project_id,
-                "target_format": fmt
-            }
-
-            response = client.post("/api/ai_editor/technical-check", json=request_data)
-            assert response.status_code == 200
-            assert response.json()["result"] == f"Content in {fmt} format"
-
-    def test_technical_check_missing_format(self, sample_project_id):
+        assert fake_ai_editor_service.calls == [
+            ("technical_check", dict(text_with_metadata=text_with_metadata, target_format="SRT", provider="ollama", project_id=sample_project_id))
+        ]
+
+    @pytest.mark.parametrize("fmt", ["SRT", "VTT", "transcript", "chapters"])
+    async def test_technical_check_all_formats(self, aclient, fake_ai_editor_service, sample_project_id, fmt):
+        """Test technical check with each supported format."""
+        fake_ai_editor_service.set("technical_check", {"result": f"Content in {fmt} format"})
+
+        request_data = {
+            "text_with_metadata": "[00:00] Speaker: Test content",
+            "project_id": sample_project_id,
+            "target_format": fmt
+        }
+
+        response = await aclient.post("/api/ai_editor/technical-check", json=request_data)
+        assert response.status_code == 200
+        assert response.json()["result"] == f"Content in {fmt} format"
+
+    async def test_technical_check_missing_format(self, aclient, sample_project_id):
         """Test technical check with missing target_format field."""
         request_data = {
             "text_with_metadata": "[00:00] Speaker: Test",
             "project_id": sample_project_id
         }
 
-        response = client.post("/api/ai_editor/technical-check", json=request_data)
+        response = await aclient.post("/api/ai_editor/technical-check", json=request_data)
         assert response.status_code == 422
 
 
@@ -333,62 +384,39 @@ class TestAIEditorServiceIntegration:
     """Integration tests for AI editor service functionality."""
 
     @patch('app.services.ai_editor_service.LLMService')
-    def test_ai_editor_service_logging(self, mock_llm_service, sample_project_id, sample_text):
+    def test_ai_editor_service_logging(self, mock_llm_service, mock_db_session, mock_llm):
         """Test that AI editor service properly initializes with required dependencies."""
         # Create a real service instance for integration testing
         from app.services.ai_editor_service import AIEditorService
-        from sqlalchemy.orm import Session
-        
-        # Create mock db session and llm service
-        mock_db = MagicMock(spec=Session)
-        mock_llm = MagicMock()
-        
-        service = AIEditorService(db=mock_db, llm_service=mock_llm)
-        
+
+        service = AIEditorService(db=mock_db_session, llm_service=mock_llm)
+
         # Test that the service was initialized properly
-        assert service.db == mock_db
+        assert service.db == mock_db_session
         assert service.llm_service == mock_llm
 
-    def test_error_handling_in_endpoints(self, mock_ai_editor_service, sample_project_id, sample_text):
+    async def test_error_handling_in_endpoints(self, aclient, fake_ai_editor_service):
         """Test error handling across all AI editor endpoints."""
-        # Test that all endpoints handle service errors gracefully
-        endpoints_and_data = [
-            ("/api/ai_editor/semantic-reconstruction", {"text": sample_text, "project_id": sample_project_id}),
-            ("/api/ai_editor/style-generation", {"text": sample_text, "project_id": sample_project_id, "target_style": "academic"}),
-            ("/api/ai_editor/nlp-analysis", {"text": sample_text, "project_id": sample_project_id}),
-            ("/api/ai_editor/fact-checking", {"text": sample_text, "project_id": sample_project_id}),
-            ("/api/ai_editor/technical-check", {"text_with_metadata": "[00:00] " + sample_text, "project_id": sample_project_id, "target_format": "SRT"}),
-        ]
-        
-        for endpoint, data in endpoints_and_data:
-            # Configure mock to raise an exception
-            for method in [mock_ai_editor_service.semantic_reconstruction,
-                          mock_ai_editor_service.style_generation,
-                          mock_ai_editor_service.nlp_analysis,
-                          mock_ai_editor_service.fact_checking,
-                          mock_ai_editor_service.technical_check]:
-                method.side_effect = Exception("Service error")
-            
-            response = client.post(endpoint, json=data)
+        for _, _, method_name in ENDPOINTS_AND_DATA:
+            fake_ai_editor_service.set(method_name, Exception("Service error"))
+
+        # The fake answers immediately, so all five requests can run concurrently
+        responses = await asyncio.gather(*[
+            aclient.post(endpoint, json=data) for endpoint, data, _ in ENDPOINTS_AND_DATA
+        ])
+
+        for (endpoint, _, _), response in zip(ENDPOINTS_AND_DATA, responses):
             assert response.status_code == 500, f"Endpoint {endpoint} should return 500 on service error"
 
 
 class TestValidation:
     """Test input validation for all AI editor endpoints."""
 
-    def test_empty_request_bodies(self):
-        """Test all endpoints with empty request bodies."""
-        endpoints = [
-            "/api/ai_editor/semantic-reconstruction",
-            "/api/ai_editor/style-generation",
-            "/api/ai_editor/nlp-analysis",
-            "/api/ai_editor/fact-checking",
-            "/api/ai_editor/technical-check"
-        ]
-        
-        for endpoint in endpoints:
-            response = client.post(endpoint, json={})
-            assert response.status_code == 422, f"Endpoint {endpoint} should validate required fields"
+    @pytest.mark.parametrize("endpoint", [endpoint for endpoint, _, _ in ENDPOINTS_AND_DATA])
+    async def test_empty_request_bodies(self, aclient, endpoint):
+        """Test that each endpoint rejects an empty request body."""
+        response = await aclient.post(endpoint, json={})
+        assert response.status_code == 422, f"Endpoint {endpoint} should validate required fields"
 
     def test_invalid_enum_values(self, sample_project_id, sample_text):
         """Test endpoints with invalid enum values."""
@@ -396,7 +424,7 @@ class TestValidation:
         # This test is disabled until enum validation is implemented
         pass
 
-    def test_invalid_project_id_types(self, sample_text):
+    async def test_invalid_project_id_types(self, aclient, sample_text):
         """Test endpoints with invalid project_id types."""
         endpoints_and_data = [
             ("/api/ai_editor/semantic-reconstruction", {"text": sample_text, "project_id": "not_a_number"}),
@@ -404,5 +432,5 @@ class TestValidation:
         ]
         
         for endpoint, data in endpoints_and_data:
-            response = client.post(endpoint, json=data)
+            response = await aclient.post(endpoint, json=data)
             assert response.status_code == 422, f"Endpoint {endpoint} should validate project_id type"
\ No newline at end of file
@@ -1,10 +1,7 @@
 import pytest
-from fastapi.testclient import TestClient
 
-from app.main import app
 from app.api.ai_editor import get_ai_editor_service
 
-
 TEST_PROJECT_ID = 20
 TEST_EDITOR_TEXT = (
     "Welcome! Thanks for meeting today to review the release plan. "
@@ -147,24 +144,43 @@ class StubAIEditorService:
         }
 
 
-client = TestClient(app)
+@pytest.fixture(scope="session")
+def app_instance(ai_editor_app):
+    """Serve aclient from the AI editor router alone, without middleware or lifespan."""
+    return ai_editor_app
+
+
+@pytest.fixture(scope="session")
+def _stub_provider():
+    """
+    Dependency provider returning one shared stub for the whole session.
+    """
+    stub = StubAIEditorService()
+    return lambda: stub
 
 
 @pytest.fixture(autouse=True)
-def override_ai_editor_service():
+def override_ai_editor_service(app_instance, _stub_provider):
     """
     Override the AI editor dependency with the deterministic stub for every test.
     """
-    stub = StubAIEditorService()
-    app.dependency_overrides[get_ai_editor_service] = lambda: stub
+    stub = _stub_provider()
+    # recorded_calls is the stub's only state
+    stub.recorded_calls.clear()
+    # Snapshot and restore rather than pop, so an outer override survives this test
+    previous = app_instance.dependency_overrides.get(get_ai_editor_service)
+    app_instance.dependency_overrides[get_ai_editor_service] = _stub_provider
     try:
         yield stub
     finally:
-        app.dependency_overrides.pop(get_ai_editor_service, None)
+        if previous is None:
+            app_instance.dependency_overrides.pop(get_ai_editor_service, None)
+        else:
+            app_instance.dependency_overrides[get_ai_editor_service] = previous
 
 
-def test_semantic_reconstruction_returns_relevant_response(override_ai_editor_service):
-    response = client.post(
+async def test_semantic_reconstruction_returns_relevant_response(aclient, override_ai_editor_service):
+    response = await aclient.post(
         "/api/ai_editor/semantic-reconstruction",
         json={"text": TEST_EDITOR_TEXT, "project_id": TEST_PROJECT_ID},
     )
@@ -179,9 +195,9 @@ def test_semantic_reconstruction_returns_relevant_response(override_ai_editor_se
     assert call_args["provider"] == "ollama"
 
 
-def test_style_generation_returns_relevant_response(override_ai_editor_service):
+async def test_style_generation_returns_relevant_response(aclient, override_ai_editor_service):
     target_style = "formal briefing"
-    response = client.post(
+    response = await aclient.post(
         "/api/ai_editor/style-generation",
         json={
             "text": TEST_EDITOR_TEXT,
@@ -202,8 +218,8 @@ def test_style_generation_returns_relevant_response(override_ai_editor_service):
     assert call_args["provider"] == "ollama"
 
 
-def test_nlp_analysis_returns_structured_relevant_summary(override_ai_editor_service):
-    response = client.post(
+async def test_nlp_analysis_returns_structured_relevant_summary(aclient, override_ai_editor_service):
+    response = await aclient.post(
         "/api/ai_editor/nlp-analysis",
         json={"text": TEST_EDITOR_TEXT, "project_id": TEST_PROJECT_ID},
     )
@@ -220,9 +236,9 @@ def test_nlp_analysis_returns_structured_relevant_summary(override_ai_editor_ser
     assert call_args["provider"] == "ollama"
 
 
-def test_fact_checking_marks_relevant_findings(override_ai_editor_service):
+async def test_fact_checking_marks_relevant_findings(aclient, override_ai_editor_service):
     domain = "product strategy"
-    response = client.post(
+    response = await aclient.post(
         "/api/ai_editor/fact-checking",
         json={
             "text": TEST_EDITOR_TEXT,
@@ -243,8 +259,8 @@ def test_fact_checking_marks_relevant_findings(override_ai_editor_service):
     assert call_args["provider"] == "ollama"
 
 
-def test_technical_check_confirms_relevant_export(override_ai_editor_service):
-    response = client.post(
+async def test_technical_check_confirms_relevant_export(aclient, override_ai_editor_service):
+    response = await aclient.post(
         "/api/ai_editor/technical-check",
         json={
             "text_with_metadata": TEST_TECHNICAL_TEXT,
@@ -144,8 +144,7 @@ def test_export_multiple_segments(client, test_db, sample_project, sample_audio_
         for i in range(5)
     ]
 
-    for seg in segments:
-        test_db.add(seg)
+    test_db.add_all(segments)
     test_db.commit()
 
     response = client.get(f"/api/export/{sample_audio_file.id}/srt")
@@ -227,8 +226,7 @@ def test_export_project_srt_success(client, test_db, sample_project):
         )
     ]
 
-    for seg in segments1 + segments2:
-        test_db.add(seg)
+    test_db.add_all(segments1 + segments2)
     test_db.commit()
 
     response = client.get(
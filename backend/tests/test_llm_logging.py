@@ -1,6 +1,8 @@
 """
 Tests for LLM request/response logging functionality.
 """
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import AsyncMock, patch
 from sqlalchemy.orm import Session
@@ -64,13 +66,14 @@ def test_llm_log_with_error(test_db: Session):
 @pytest.mark.asyncio
 async def test_ollama_provider_logs_successful_request(test_db: Session):
     """Test that OllamaProvider logs successful requests."""
-    from unittest.mock import MagicMock
-
     provider = OllamaProvider(db=test_db)
 
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"response": "This is the corrected text."}
+    # Plain data object; only the post() call itself needs a mock
+    mock_response = SimpleNamespace(
+        status_code=200,
+        json=lambda: {"response": "This is the corrected text."},
+        raise_for_status=lambda: None,
+    )
 
     with patch("httpx.AsyncClient.post", new_callable=AsyncMock, return_value=mock_response):
         result = await provider.correct_text(
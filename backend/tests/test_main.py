@@ -36,3 +36,14 @@ def test_health_endpoint(client):
         assert component_name in components
         assert "status" in components[component_name]
         assert "message" in components[component_name]
+
+
+def test_health_endpoint_wait_returns_after_timeout(client):
+    """The health check can long-poll for Whisper readiness with a bounded wait."""
+    response = client.get("/health", params={"wait": 0.01})
+    assert response.status_code == 200
+    assert response.json()["components"]["whisper"]["status"] in [
+        "idle", "up", "processing", "downloading", "loading", "unknown"
+    ]
+
+    assert client.get("/health", params={"wait": 60}).status_code == 422
@@ -3,6 +3,7 @@ Tests for transcription API endpoints.
 """
 import json
 import os
+import pickle
 import sys
 import threading
 import time
@@ -11,9 +12,10 @@ from io import BytesIO
 from unittest.mock import Mock, patch
 
 import pytest
+from sqlalchemy.orm import Session
 
 from app.core import database as database_module
-from app.models.audio_file import AudioFile, TranscriptionStatus
+from app.models.audio_file import AudioFile, TranscriptionStatus, TranscriptionStageCode
 from app.models.segment import Segment
 from app.services import transcription_service as transcription_service_module
 from app.services.transcription_service import TranscriptionService
@@ -83,6 +85,67 @@ def test_start_transcription(client, project_with_file, test_db):
         mock_add_pending.assert_called_once()
         mock_init.assert_called_once()
 
+        # Queued file is findable through the indexed stage code
+        audio_file = test_db.query(AudioFile).filter(AudioFile.id == file_id).first()
+        test_db.refresh(audio_file)
+        assert audio_file.transcription_stage_code == TranscriptionStageCode.MODEL_LOADING.value
+
+
+def test_model_loading_progress_never_drops_for_queued_file(client, project_with_file, test_db, monkeypatch):
+    """Download progress only raises a queued file's progress above its initial 5%."""
+    from app.services import transcription_singleton
+
+    file_id = project_with_file["file_id"]
+    monkeypatch.setattr("app.api.transcription.is_transcription_service_ready", lambda: False)
+    monkeypatch.setattr("app.api.transcription.initialize_transcription_service", lambda: None)
+    monkeypatch.setattr("app.api.transcription.add_pending_transcription", lambda *args, **kwargs: None)
+
+    def test_db_session():
+        # The updater closes its session, so give it its own on the test database
+        yield Session(bind=test_db.get_bind())
+
+    monkeypatch.setattr(transcription_singleton, "get_db", test_db_session)
+
+    response = client.post(f"/api/transcription/{file_id}/start", json={"include_diarization": False})
+    assert response.status_code == 202
+
+    seen = [test_db.get(AudioFile, file_id).transcription_progress]
+    for download_percent in (20, 40, 80, 100):
+        monkeypatch.setattr(
+            transcription_singleton,
+            "get_model_download_progress",
+            lambda percent=download_percent: {"progress": percent},
+        )
+        transcription_singleton.update_model_loading_progress_in_db()
+        test_db.expire_all()
+        seen.append(test_db.get(AudioFile, file_id).transcription_progress)
+
+    assert seen == sorted(seen)
+    assert seen[:3] == [0.05, 0.05, 0.05]
+    assert seen[-1] == pytest.approx(0.10)
+
+
+def test_transcribe_task_failure_clears_model_loading_code(project_with_file, test_db, monkeypatch):
+    """A queued file that fails before its first stage update is no longer tagged MODEL_LOADING."""
+    from app.api import transcription as transcription_api
+
+    file_id = project_with_file["file_id"]
+    audio_file = test_db.get(AudioFile, file_id)
+    audio_file.transcription_stage_code = TranscriptionStageCode.MODEL_LOADING.value
+    test_db.commit()
+
+    def failing_service():
+        raise RuntimeError("Whisper model not loaded")
+
+    monkeypatch.setattr(database_module, "SessionLocal", lambda: Session(bind=test_db.get_bind()))
+    monkeypatch.setattr(transcription_api, "get_transcription_service", failing_service)
+
+    with pytest.raises(RuntimeError):
+        transcription_api.transcribe_task(file_id, include_diarization=False)
+
+    test_db.expire_all()
+    assert test_db.get(AudioFile, file_id).transcription_stage_code is None
+
 
 def test_get_segments_empty(client, project_with_file):
     """Test getting segments before transcription."""
@@ -520,3 +583,82 @@ def test_split_status_includes_origin_details(client, project_with_file, monkeyp
     assert body["split_origin_filename"] is not None
     assert body["split_start_seconds"] is not None
     assert body["split_end_seconds"] is not None
+
+
+@pytest.fixture
+def mmap_whisper(monkeypatch, tmp_path):
+    """Fake torch, whisper.model and whisper internals around a small saved checkpoint."""
+    service = TranscriptionService(model_size_override="tiny")
+    checkpoint_path = tmp_path / "tiny.pt"
+    checkpoint_path.write_bytes(pickle.dumps({
+        "dims": {"n_mels": 80, "n_text_layer": 1},
+        "model_state_dict": {"decoder.weight": [0.5]},
+    }))
+    calls = {}
+
+    def fake_torch_load(path, **kwargs):
+        calls["torch_load"] = (path, kwargs)
+        with open(path, "rb") as checkpoint_file:
+            return pickle.load(checkpoint_file)
+
+    class FakeWhisper:
+        def __init__(self, dims):
+            self.dims = dims
+
+        def load_state_dict(self, state_dict, **kwargs):
+            calls["load_state_dict"] = (state_dict, kwargs)
+
+        def set_alignment_heads(self, heads):
+            calls["alignment_heads"] = heads
+
+        def to(self, **kwargs):
+            calls["to"] = kwargs
+            return self
+
+    fake_torch = types.SimpleNamespace(load=fake_torch_load, float32="torch.float32")
+    fake_model_module = types.SimpleNamespace(ModelDimensions=lambda **dims: dims, Whisper=FakeWhisper)
+    whisper_module = types.SimpleNamespace(
+        _MODELS={"tiny": "https://example.invalid/tiny.pt"},
+        _ALIGNMENT_HEADS={"tiny": b"alignment-heads"},
+        _download=lambda url, root, in_memory: str(checkpoint_path),
+        load_model=lambda name, device=None: ("whisper.load_model", name, device),
+    )
+    monkeypatch.setitem(sys.modules, "torch", fake_torch)
+    monkeypatch.setitem(sys.modules, "whisper.model", fake_model_module)
+    return types.SimpleNamespace(
+        service=service, whisper=whisper_module, torch=fake_torch,
+        checkpoint_path=str(checkpoint_path), calls=calls,
+    )
+
+
+def test_load_whisper_model_memory_maps_checkpoint(mmap_whisper):
+    """Known models load from a memory-mapped checkpoint, assigned and cast to fp32 on the device."""
+    stages = []
+
+    model = mmap_whisper.service._load_whisper_model(
+        mmap_whisper.whisper, "tiny", "cuda", progress_callback=stages.append
+    )
+
+    calls = mmap_whisper.calls
+    assert calls["torch_load"] == (
+        mmap_whisper.checkpoint_path,
+        {"map_location": "cpu", "mmap": True, "weights_only": True},
+    )
+    assert calls["load_state_dict"] == ({"decoder.weight": [0.5]}, {"assign": True})
+    assert calls["alignment_heads"] == b"alignment-heads"
+    assert calls["to"] == {"device": "cuda", "dtype": mmap_whisper.torch.float32}
+    assert model.dims == {"n_mels": 80, "n_text_layer": 1}
+    assert stages == ["Complete - loading into memory", "Loaded - moving to cuda"]
+
+
+@pytest.mark.parametrize("error", [RuntimeError("legacy format"), pickle.UnpicklingError("bad pickle")])
+def test_load_whisper_model_falls_back_when_checkpoint_cannot_be_mapped(mmap_whisper, monkeypatch, error):
+    """A checkpoint torch cannot memory-map is loaded through whisper.load_model instead."""
+    def failing_load(path, **kwargs):
+        raise error
+
+    monkeypatch.setattr(mmap_whisper.torch, "load", failing_load)
+
+    model = mmap_whisper.service._load_whisper_model(mmap_whisper.whisper, "tiny", "cpu")
+
+    assert model == ("whisper.load_model", "tiny", "cpu")
@@ -0,0 +1,214 @@
+"""
+Tests for the transcription service singleton's pending queue and readiness helpers.
+"""
+import threading
+import time
+
+import pytest
+
+from app.services import transcription_service as transcription_service_module
+from app.services import transcription_singleton
+from app.services.transcription_service import TranscriptionService
+
+
+@pytest.fixture(autouse=True)
+def empty_pending_queue():
+    """Start and finish every test with an empty pending queue."""
+    transcription_singleton.get_pending_transcriptions()
+    yield
+    # Let background drains started by initialization finish before the next test queues work
+    for thread in threading.enumerate():
+        if thread.name == "pending-drain":
+            thread.join(timeout=5)
+    transcription_singleton.get_pending_transcriptions()
+
+
+def test_add_pending_transcription_updates_existing_entry():
+    """Re-queuing a file updates its settings instead of adding a duplicate."""
+    transcription_singleton.add_pending_transcription(1, model_size="tiny")
+    transcription_singleton.add_pending_transcription(2)
+    transcription_singleton.add_pending_transcription(1, model_size="small", force_restart=True)
+
+    pending = transcription_singleton.get_pending_transcriptions()
+
+    assert [entry["file_id"] for entry in pending] == [1, 2]
+    assert pending[0]["model_size"] == "small"
+    assert pending[0]["force_restart"] is True
+
+
+def test_get_pending_transcriptions_drains_queue():
+    """Fetching the pending queue empties it."""
+    transcription_singleton.add_pending_transcription(3, include_diarization=False)
+    assert transcription_singleton.has_pending_transcriptions()
+
+    pending = transcription_singleton.get_pending_transcriptions()
+
+    assert pending == [
+        {
+            "file_id": 3,
+            "include_diarization": False,
+            "model_size": None,
+            "language": None,
+            "force_restart": False,
+        }
+    ]
+    assert not transcription_singleton.has_pending_transcriptions()
+    assert transcription_singleton.get_pending_transcriptions() == []
+
+
+def test_process_pending_transcriptions_bounds_concurrency(monkeypatch):
+    """Queued files are transcribed by at most WHISPER_TRANSCRIBE_CONCURRENCY workers."""
+    lock = threading.Lock()
+    done = threading.Event()
+    state = {"running": 0, "max_running": 0, "calls": []}
+
+    def fake_transcribe_task(audio_file_id, **kwargs):
+        with lock:
+            state["running"] += 1
+            state["max_running"] = max(state["max_running"], state["running"])
+        time.sleep(0.01)
+        with lock:
+            state["running"] -= 1
+            state["calls"].append(audio_file_id)
+            if len(state["calls"]) == 4:
+                done.set()
+
+    monkeypatch.setattr("app.api.transcription.transcribe_task", fake_transcribe_task)
+    monkeypatch.setattr(transcription_singleton.settings, "WHISPER_TRANSCRIBE_CONCURRENCY", 1)
+    for file_id in range(1, 5):
+        transcription_singleton.add_pending_transcription(file_id)
+
+    transcription_singleton.process_pending_transcriptions()
+
+    assert done.wait(timeout=5)
+    assert state["calls"] == [1, 2, 3, 4]
+    assert state["max_running"] == 1
+
+
+def test_readiness_follows_service_lifecycle(monkeypatch):
+    """The service reports ready once published and not ready after cleanup."""
+    monkeypatch.setattr(transcription_singleton.settings, "E2E_TRANSCRIPTION_STUB", True)
+    transcription_singleton.cleanup_transcription_service()
+    assert not transcription_singleton.is_transcription_service_ready()
+
+    transcription_singleton.initialize_transcription_service()
+    try:
+        assert transcription_singleton.is_transcription_service_ready()
+        assert transcription_singleton.get_transcription_service().model == "stub"
+    finally:
+        transcription_singleton.cleanup_transcription_service()
+
+    assert not transcription_singleton.is_transcription_service_ready()
+
+
+def test_wait_until_ready_times_out_until_service_is_published(monkeypatch):
+    """wait_until_ready blocks only while the service is not yet published."""
+    monkeypatch.setattr(transcription_singleton.settings, "E2E_TRANSCRIPTION_STUB", True)
+    transcription_singleton.cleanup_transcription_service()
+    assert transcription_singleton.wait_until_ready(timeout=0.01) is False
+
+    initializer = threading.Timer(0.05, transcription_singleton.initialize_transcription_service)
+    initializer.start()
+    try:
+        assert transcription_singleton.wait_until_ready(timeout=5) is True
+    finally:
+        initializer.join(timeout=5)
+        transcription_singleton.cleanup_transcription_service()
+
+
+def test_model_load_publishes_progress_until_ready(monkeypatch):
+    """Stages reported while the model loads are visible to progress polls, then cleared."""
+    seen = []
+
+    def fake_load(self, whisper_module, target_size, device, progress_callback=None):
+        progress_callback("Complete - loading into memory")
+        seen.append(transcription_singleton.get_model_download_progress())
+        return object()
+
+    monkeypatch.setattr(transcription_singleton.settings, "E2E_TRANSCRIPTION_STUB", False)
+    monkeypatch.setattr(transcription_singleton, "_determine_initial_model_size", lambda: "tiny")
+    monkeypatch.setattr(TranscriptionService, "_load_whisper_model", fake_load)
+    transcription_singleton.cleanup_transcription_service()
+
+    try:
+        transcription_singleton.initialize_transcription_service()
+
+        assert seen == [
+            {
+                "progress": 100,
+                "downloaded": "72MB",
+                "total": "72MB",
+                "speed": "Complete - loading into memory",
+                "model_size": "tiny",
+            }
+        ]
+        assert transcription_singleton._download_progress is None
+    finally:
+        transcription_singleton.cleanup_transcription_service()
+
+
+def test_initial_model_size_follows_runtime_setting_changes(monkeypatch):
+    """The configured default is read when needed, not frozen at import time."""
+    monkeypatch.setattr(transcription_singleton.settings, "WHISPER_MODEL_SIZE", "small")
+    assert transcription_singleton._determine_initial_model_size() == "small"
+
+    monkeypatch.setattr(transcription_singleton.settings, "WHISPER_MODEL_SIZE", "medium")
+    assert transcription_singleton._determine_initial_model_size() == "medium"
+
+
+@pytest.mark.parametrize(
+    "model_size, expected",
+    [
+        ("small", ("small.pt",)),
+        ("medium.en", ("medium.en.pt",)),
+        ("large", ("large-v3.pt", "large-v2.pt", "large.pt")),
+        ("turbo", ("large-v3-turbo.pt",)),
+        ("custom", ("custom.pt",)),
+    ],
+)
+def test_model_cache_candidates_match_whisper_checkpoint_names(model_size, expected):
+    """Cache lookups use the filenames Whisper actually downloads to."""
+    assert transcription_singleton._model_cache_candidates(model_size) == expected
+
+
+def test_cache_lookups_honour_xdg_cache_home(monkeypatch, tmp_path):
+    """Cached-model checks look where Whisper downloads to when XDG_CACHE_HOME is set."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    transcription_service_module.whisper_cache_dir.cache_clear()
+    transcription_singleton._resolve_model_paths.cache_clear()
+    try:
+        assert not transcription_singleton.is_model_cached_on_disk("tiny")
+
+        (tmp_path / "whisper").mkdir()
+        (tmp_path / "whisper" / "tiny.pt").write_bytes(b"")
+
+        assert transcription_singleton.is_model_cached_on_disk("tiny")
+        assert transcription_singleton._resolve_model_paths("tiny") == (
+            ("tiny.pt", str(tmp_path / "whisper" / "tiny.pt")),
+        )
+    finally:
+        transcription_service_module.whisper_cache_dir.cache_clear()
+        transcription_singleton._resolve_model_paths.cache_clear()
+
+
+def test_initialization_drains_pending_queue_in_background(monkeypatch):
+    """Initialization returns before queued transcriptions are handed to workers."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def fake_transcribe_task(audio_file_id, **kwargs):
+        started.set()
+        release.wait(timeout=5)
+
+    monkeypatch.setattr("app.api.transcription.transcribe_task", fake_transcribe_task)
+    monkeypatch.setattr(transcription_singleton.settings, "E2E_TRANSCRIPTION_STUB", True)
+    transcription_singleton.cleanup_transcription_service()
+    transcription_singleton.add_pending_transcription(7)
+
+    try:
+        transcription_singleton.initialize_transcription_service()
+        assert transcription_singleton.is_transcription_service_ready()
+        assert started.wait(timeout=5)
+    finally:
+        release.set()
+        transcription_singleton.cleanup_transcription_service()